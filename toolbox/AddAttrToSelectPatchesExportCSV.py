@@ -41,6 +41,11 @@ park_path = os.path.join(park_gdb, f"{park}_")
 # Prevent outputs from being added to the map
 arcpy.env.addOutputsToMap = False
 
+# Read the land management and watershed polygons fresh for this run
+addAttrUtils.read_polygons.cache_clear()
+# Read the change types fresh for this run
+expPatchesFunctions.load_change_types.cache_clear()
+
 # Get/set default geodatabase
 gdb = addAttrUtils.set_default_gdb_workspace()
 # Create path for patches feature class
@@ -62,6 +67,9 @@ addAttr.add_attr_patches(
     False
 )
 
+# Release the cached polygons, so the next run reads them fresh
+addAttrUtils.read_polygons.cache_clear()
+
 # Update the area and perim fields
 addAttrUtils.update_area_perim(patches_fc)
 
@@ -72,7 +80,7 @@ addAttrFunctions.add_paratio(patches_fc)
 addAttrUtils.del_select_patches(all_patches, patches_fc)
 
 # Add the select patches to all_patches
-arcpy.management.Append(patches_fc, all_patches, schema_type="TEST_AND_SKIP")
+addAttrUtils.append_patches(patches_fc, all_patches)
 
 # Export patches to CSV
 expPatchesFunctions.export_patches_csv(patches_fc, out_csv)
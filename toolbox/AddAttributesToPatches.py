@@ -10,10 +10,10 @@ years. Next, the Event fields are added (if applicable), and labels are added to
 """
 import arcpy
 import os
+import re
 import addAttr
 import addAttrFunctions
 import addAttrUtils
-import eventsFunctions
 
 
 # === User inputs === #
@@ -55,13 +55,20 @@ changeDB_fc = os.path.join(run_gdb, f"{park}_changeDB")
 park_path = os.path.join(park_gdb, f"{park}_")
 
 # === ADD ATTRIBUTES AND CREATE CHANGEDB.SHP === #
+# Read the land management and watershed polygons fresh for this run, they are reused for every year
+addAttrUtils.read_polygons.cache_clear()
+
 # GET A LIST OF ALL SHAPEFILES IN THE FOLDER
 # Change current working directory to patch_folder
 arcpy.env.workspace = patches_folder
 # Get a list of all the shapefiles in the patches_folder
 shps = arcpy.ListFiles("*.shp")
-# Keep only shapefiles that end in a year (four-digit number)
-shps = [shp for shp in shps if shp[-8:-4].isdigit()]
+# Keep only the change shapefiles (change_ and a four-digit year), keyed by the year, so each year has one shapefile
+shp_yr_pattern = re.compile(r"change_(\d{4})\.shp")
+shps_by_yr = {int(m.group(1)): shp for shp in shps for m in [shp_yr_pattern.fullmatch(shp)] if m}
+# Sort the shapefiles by year and create a lookup for the index of each year
+shps = [shps_by_yr[yr] for yr in sorted(shps_by_yr)]
+yr_indexes = {yr: i for i, yr in enumerate(sorted(shps_by_yr))}
 
 # Initally set year to start with to zero
 yr_index = 0
@@ -80,18 +87,17 @@ if resume_prev or shp_yr:
     # Get the last year in changeDB_fc
     if arcpy.Exists(changeDB_fc):
         # Get last year for prev_fc
-        yrs = [row[0] for row in arcpy.da.SearchCursor(changeDB_fc, ["yod"])]
-        last_yr = max(yrs)
+        last_yr = addAttrUtils.get_max_value(changeDB_fc, "yod")
 
         try:
             # Get the index of that year to start at that index
             if resume_prev:
                 # Resume with the year after the last one in changeDB
                 resume_yr = last_yr + 1
-                yr_index = shps.index(f"change_{resume_yr}.shp")
+                yr_index = yr_indexes[resume_yr]
             if shp_yr:
-                yr_index = shps.index(f"change_{shp_yr}.shp")
-        except ValueError:
+                yr_index = yr_indexes[int(shp_yr)]
+        except KeyError:
             arcpy.AddError("The shapefile for the year to resume with was not found.")
             raise arcpy.ExecuteError
 
@@ -127,18 +133,22 @@ if resume_prev:
 # If the user entered a Year to Start With,
 if shp_yr:
     # Although the layer is for the previous year's patches, in the loop, prev_fc gets set to base_fc
-    base_fc = os.path.join(default_gdb, f"change_{shp_yr}")
-
-    # Select patches for the last year in the chnageDB
-    arcpy.management.SelectLayerByAttribute(
-        changeDB_fc,
-        'NEW_SELECTION',
-        f'yod = {last_yr}',
-        'NON_INVERT'
+    # Named with the last year, so it does not collide with the feature class for shp_yr
+    base_fc = os.path.join(default_gdb, f"change_{last_yr}")
+
+    # Create a feature class in the default geodatabase with the patches for the last year in the changeDB
+    arcpy.conversion.ExportFeatures(
+        in_features=changeDB_fc,
+        out_features=base_fc,
+        where_clause=f"yod = {last_yr}"
     )
 
-    # Create a feature class in the default geodatabase
-    arcpy.management.CopyFeatures(changeDB_fc, base_fc)
+# If resuming, remove the spatial index from changeDB_fc, so it is not updated by every Append (rebuilt after the loop)
+if arcpy.Exists(changeDB_fc) and arcpy.Describe(changeDB_fc).hasSpatialIndex:
+    arcpy.management.RemoveSpatialIndex(changeDB_fc)
+
+# Patches folder path with a trailing separator to create the shapefile file paths in the loop
+patches_folder_sep = f"{patches_folder}{os.sep}"
 
 # ADD ATTRIBUTES TO EACH SHAPEFILE
 for i in range(yr_index, len(shps)):
@@ -158,39 +168,24 @@ for i in range(yr_index, len(shps)):
         # Get shapefile basename sans .shp
         shp_name = shp[:-4]
         # Create the filepath for the shapefile
-        shp_fp = os.path.join(patches_folder, shp)
+        shp_fp = f"{patches_folder_sep}{shp}"
 
-        # Convert shapefile to feature class
-        arcpy.conversion.FeatureClassToGeodatabase(shp_fp, gdb)
-        # Create path for feature class
-        patches_fc = os.path.join(gdb, shp_name)
+        # Create path for feature class and copy the shapefile to it
+        patches_fc = f"{gdb}{os.sep}{shp_name}"
+        arcpy.management.CopyFeatures(shp_fp, patches_fc)
 
-    # Add the attributes using the primary function
-    addAttr.add_attr_patches(
+    # Add the attributes that only depend on this year's patches (attributes, paratio, Event fields and mask labels)
+    addAttr.add_attr_year_patches(
         patches_fc,
         zone_field,
         pro_cell_size,
         park,
         park_path,
         clip_patches_sa,
-        mmu
+        mmu,
+        events_mask
     )
 
-    # Add paratio, must happen separate since Add Attributes to Select Patches also utilizes addAttr.add_attr_patches(),
-    # and area and perim do not get updated until after addAttr.add_attr_patches().
-    addAttrFunctions.add_paratio(patches_fc)
-
-    # Add Event fields, elevation mask, and water/lakes mask
-    if events_mask:
-        eventsFunctions.add_event_fields(patches_fc)
-
-        if park != "LEWI":
-            eventsFunctions.label_elev_mask(patches_fc)
-
-        # Water mask feature class for labeling patches with Annual Variability
-        water_fc = f"{park_path}water_fc"
-        eventsFunctions.label_water_mask(patches_fc, water_fc)
-
     # The base from the last loop becomes the previous, and current patches become base
     prev_fc = base_fc
     base_fc = patches_fc
@@ -215,6 +210,8 @@ for i in range(yr_index, len(shps)):
     # Create a new feature class if it doesn't exist
     if not arcpy.Exists(changeDB_fc):
         arcpy.management.CopyFeatures(patches_fc, changeDB_fc)
+        # Remove the spatial index, so it is not updated by every Append (rebuilt after the loop)
+        arcpy.management.RemoveSpatialIndex(changeDB_fc)
     # Append if it does
     else:
         arcpy.management.Append(patches_fc, changeDB_fc, schema_type="TEST_AND_SKIP")
@@ -222,14 +219,22 @@ for i in range(yr_index, len(shps)):
 # Clean up the default geodatabase after
 arcpy.management.Delete(base_fc)
 
+# Release the cached polygons now that all the years have their attributes and mask labels, so the next run reads them
+# fresh
+addAttrUtils.read_polygons.cache_clear()
+
+# Rebuild the spatial index once now that all the years have been added
+arcpy.management.AddSpatialIndex(changeDB_fc)
+
 # Get start year and end year for PatchName and to change the GDB name
-yrs = [row[0] for row in arcpy.da.SearchCursor(changeDB_fc, ["yod"])]
-start_yr = min(yrs)
-end_yr = max(yrs)
+start_yr, end_yr = addAttrUtils.get_min_max_values(changeDB_fc, "yod")
 
 # Add Park and PatchName
 addAttrFunctions.add_park_patch_name(changeDB_fc, park, mmu, start_yr, end_yr)
 
+# Index PatchName since it is the field used to join labels to the patches
+arcpy.management.AddIndex(changeDB_fc, "PatchName", "PatchName_idx")
+
 # Rename changeDB
 new_changeDB_fc = f"{park}_changeDB_{start_yr}_{end_yr}"
 arcpy.env.workspace = run_gdb
@@ -4,6 +4,7 @@ tool, getting a list of feature classes to process, looping through them and eit
 shapefile for Google Earth Engine.
 """
 import arcpy
+import itertools
 import os
 import expPatchesFunctions
 
@@ -37,50 +38,55 @@ else:
     # Get a list of the patches feature classes
     patches_fcs = arcpy.ListFeatureClasses()
 
+# Read the change types fresh for this run, they are reused for every feature class
+expPatchesFunctions.load_change_types.cache_clear()
+
 no_export_csv = False
 no_export_gee = False
 
+# Run GDB path with a trailing separator to create the patches feature class file paths in the loop
+run_gdb_sep = f"{run_gdb}{os.sep}"
+
+# See if the CSV output folder contains park folders, only need to check once since the folder does not change
+if export_csv:
+    # Get the set of folders
+    park_folders = frozenset(
+        entry.name for entry in os.scandir(csv_out_folder)
+        if entry.is_dir()
+    )
+
 # Loop through each feature class
 for fc in patches_fcs:
     # Prevent outputs from being added to the map
     arcpy.env.addOutputsToMap = False
 
     # Create patches feature class file path
-    patches_fc = os.path.join(run_gdb, fc)
+    patches_fc = f"{run_gdb_sep}{fc}"
 
     # Export to CSV
     if export_csv:
-        # See if the CSV output folder contains park folders
-        # Get the list of folders
-        csv_out_folder_list = [
-            entry.name for entry in os.scandir(csv_out_folder)
-            if entry.is_dir()
-        ]
-
         # Get the park code from the feature class name
         park_code = fc[:4]
 
-        # Check if the folder exists
-        if park_code in csv_out_folder_list:
+        # Check if the park folder exists
+        if park_code in park_folders:
             # Change output folder to park folder
             csv_save_folder = os.path.join(csv_out_folder, park_code)
         else:
-            # Change output folder to a folder called Patches
+            # Change output folder to a folder called Patches, create it if it does not exist
             csv_save_folder = os.path.join(csv_out_folder, "Patches_CSV")
-            # Check if folder exists
-            if not os.path.exists(csv_save_folder):
-                os.mkdir(csv_save_folder)
+            os.makedirs(csv_save_folder, exist_ok=True)
 
         # Create output file path
         patches_name = os.path.basename(patches_fc)
         years = patches_name[-9:]
-        out_file = f"{park_code}_patches_{years}.csv"
-        out_fp = os.path.join(csv_save_folder, out_file)
+        out_name = f"{park_code}_patches_{years}"
+        out_fp = os.path.join(csv_save_folder, f"{out_name}.csv")
 
-        # Check if file already exists, if it does, add a suffix to it until it doesn't
+        # Check if file already exists, if it does, add a numbered suffix (_1, _2, ...) until it doesn't
+        suffixes = itertools.count(1)
         while os.path.exists(out_fp):
-            out_file = f"{out_file[:-4]}_1.csv"
-            out_fp = os.path.join(csv_out_folder, out_file)
+            out_fp = os.path.join(csv_save_folder, f"{out_name}_{next(suffixes)}.csv")
 
         # Run function to export
         no_export_csv_fc = expPatchesFunctions.export_patches_csv(patches_fc, out_fp)
@@ -5,6 +5,7 @@ if they do exist.
 """
 import arcpy
 import os
+import shutil
 from datetime import datetime
 import eventsFunctions
 
@@ -35,16 +36,16 @@ if create_backup:
     backup_gdb_name = f"{run_gdb_name_no_ext}_backup_{today_date}.gdb"
     backup_gdb_path = os.path.join(backup_path, backup_gdb_name)
 
-    # Make the backup
-    arcpy.management.Copy(run_gdb_path, backup_gdb_path)
+    # Make the backup, a file geodatabase is a folder, so copy the files directly instead of using the Copy tool
+    # The lock files are not needed in the backup
+    shutil.copytree(run_gdb_path, backup_gdb_path, ignore=shutil.ignore_patterns("*.lock"))
 
 # === JOIN/UPDATE LABELS === #
-# Get a list of fields in patches feature class before joining the event fields
-patches_fields = [f.name for f in arcpy.ListFields(patches_fc)]
-# Check if field EventType exists, if it does assume the rest of the event fields exist as well
-event_fields_exist = "EventType" in patches_fields
+# Check if field EventType exists before joining the event fields, if it does assume the rest of the event fields
+# exist as well
+event_fields_exist = bool(arcpy.ListFields(patches_fc, "EventType"))
 
-# Join event fields to patches
+# Join event fields to patches, using existing indexes on PatchName or adding them if they do not exist
 arcpy.management.JoinField(
     in_data=patches_fc,
     in_field="PatchName",
@@ -53,7 +54,7 @@ arcpy.management.JoinField(
     fields="EventType;ChangeType;Confidence;AltType;ChangeDesc;DistYear;DistName",
     fm_option="NOT_USE_FM",
     field_mapping=None,
-    index_join_fields="NO_INDEXES"
+    index_join_fields="OLD_INDEXES"
 )
 
 # Update event fields if they already exist, otherwise, we don't have to do anything.
@@ -1,6 +1,6 @@
-import os
 import addAttrFunctions
 import addAttrUtils
+import eventsFunctions
 
 
 def add_attr_patches(patches_fc,
@@ -26,7 +26,7 @@ def add_attr_patches(patches_fc,
     patches because PatchName is already populated and patches have already been clipped, if necessary.
     """
     # Get and set the default gdb as the workspace
-    gdb = addAttrUtils.set_default_gdb_workspace()
+    addAttrUtils.set_default_gdb_workspace()
 
     # CHECK WHICH FIELDS ALREADY EXIST AND DELETE
     addAttrUtils.del_existing_fields(patches_fc)
@@ -77,9 +77,8 @@ def add_attr_patches(patches_fc,
     # Add centroids in Albers, UTM, and lat/long to fc
     addAttrFunctions.add_coords(patches_fc)
 
-    # Create a point feature class using X_Coord_m and Y_Coord_m and create file path
-    central_pts_sa = addAttrFunctions.create_central_points(patches_fc)
-    central_pts_sa = os.path.join(gdb, central_pts_sa)
+    # Create a point feature class in memory using X_Coord_m and Y_Coord_m
+    central_pts_sa = addAttrFunctions.create_central_points(patches_fc, zone_field)
 
     # Add LandMgmt, WildName, Watershed, InPark, InBuffer, Protected, and EastWest
     addAttrFunctions.add_attrs_points(patches_fc,
@@ -100,9 +99,62 @@ def add_attr_patches(patches_fc,
     addAttrFunctions.add_veg_type(patches_fc, veg_rst, zone_field, veg_type_tbl)
 
     # Add Elev_mean, Slope_mean, and Aspect
-    addAttrUtils.zonal_stats_rename_field(patches_fc, dem_rst, zone_field, "MEAN", "ElevMean", "FLOAT")
-    addAttrUtils.zonal_stats_rename_field(patches_fc, slope_rst, zone_field, "MEAN", "SlopeMean", "FLOAT")
-    addAttrUtils.zonal_stats_rename_field(patches_fc, aspect_rst, zone_field, "MAJORITY", "Aspect", "SHORT")
+    # The DEM, slope, and aspect rasters are aligned, so the zones are only rasterized once for all three
+    addAttrUtils.zonal_stats_many(patches_fc,
+                                  [dem_rst, slope_rst, aspect_rst],
+                                  zone_field,
+                                  ["MEAN", "MEAN", "MAJORITY"],
+                                  ["ElevMean", "SlopeMean", "Aspect"],
+                                  ["FLOAT", "FLOAT", "SHORT"])
 
     # Add zonal geometry to the shapefile
     addAttrFunctions.add_zonal_geometry(patches_fc, zone_field, pro_cell_size)
+
+
+def add_attr_year_patches(patches_fc,
+                          zone_field,
+                          pro_cell_size,
+                          park,
+                          park_path,
+                          clip_patches_sa,
+                          mmu,
+                          events_mask):
+    """
+    Adds all the attributes that only depend on a single year of patches: the attributes from add_attr_patches(),
+    paratio, and, if applicable, the Event fields and mask labels. OverlapPrv is not added because it depends on the
+    previous year of patches. Returns nothing.
+
+    :param patches_fc: str, the file path to the patches feature class (single year).
+    :param zone_field: str, the field containing the unique identifier.
+    :param pro_cell_size: int, the processing cell size for Zonal Geometry as Table.
+    :param park: str, the four-letter park code extracted from the park GDB name.
+    :param park_path: str, path to park GDB with park prefix for items in the GDB (path/to/park/gdb/PARK_)
+    :param clip_patches_sa: Boolean, whether to clip patches to study area.
+    :param mmu: int, the minimum mapping unit for the patches.
+    :param events_mask: Boolean, whether to add the Event fields and label patches in the elevation and water masks.
+    """
+    # Add the attributes using the primary function
+    add_attr_patches(
+        patches_fc,
+        zone_field,
+        pro_cell_size,
+        park,
+        park_path,
+        clip_patches_sa,
+        mmu
+    )
+
+    # Add paratio, must happen separate since Add Attributes to Select Patches also utilizes add_attr_patches(), and
+    # area and perim do not get updated until after add_attr_patches().
+    addAttrFunctions.add_paratio(patches_fc)
+
+    # Add Event fields, elevation mask, and water/lakes mask
+    if events_mask:
+        eventsFunctions.add_event_fields(patches_fc)
+
+        if park != "LEWI":
+            eventsFunctions.label_elev_mask(patches_fc)
+
+        # Water mask feature class for labeling patches with Annual Variability
+        water_fc = f"{park_path}water_fc"
+        eventsFunctions.label_water_mask(patches_fc, water_fc)
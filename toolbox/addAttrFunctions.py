@@ -6,8 +6,6 @@ Functions to support the add_attr_patches() function:
 * add_coords()
 * create_central_pts()
 * add_attrs_points()
-* add_land_mgmt_wild()
-* add_watershed()
 * add_veg_type()
 * add_zonal_geometry()
 
@@ -18,22 +16,39 @@ Functions to add additional attributes:
 """
 import os
 import arcpy
+import numpy as np
 import addAttrUtils
 
+# Spatial references used for the coordinates and central points, created once on import rather than parsed from
+# WKT each time a tool is run
+UTM10N_SR = arcpy.SpatialReference(26910)
+NAD83_SR = arcpy.SpatialReference(4269)
+ALBERS_SR = arcpy.SpatialReference()
+ALBERS_SR.loadFromString(
+    'PROJCS["Albers",GEOGCS["GCS_North_American_1983",DATUM["D_North_American_1983",SPHEROID['
+    '"GRS_1980",6378137.0,298.257222101]],PRIMEM["Greenwich",0.0],UNIT["Degree",'
+    '0.0174532925199433]],PROJECTION["Albers"],PARAMETER["false_easting",0.0],PARAMETER['
+    '"false_northing",0.0],PARAMETER["central_meridian",-96.0],PARAMETER['
+    '"standard_parallel_1",'
+    '29.5],PARAMETER["standard_parallel_2",45.5],PARAMETER["latitude_of_origin",23.0],'
+    'UNIT["Meter",1.0]];-16901100 -6972200 266467840.990852;-100000 10000;-100000 '
+    '10000;0.001;0.001;0.001;IsHighPrecision'
+)
+
 
 def clip_patches(patches_fc, study_area_fc, mmu):
     """
     Clips the patches to the study area. If the area of any patches are less than the minimum mapping unit (mmu),
     those patches are removed. The area and perim fields for the clipped patches are updated using Shape_Area and
-    Shape_Length. Deletes the original patches_fc and renames the clipped feature class to that of patches_fc. Returns
-    nothing.
+    Shape_Length. The clip is done in memory, then the original patches_fc is replaced by a copy of the clipped
+    features. Returns nothing.
 
     :param patches_fc: str, the file path to the patches feature class (single year).
     :param study_area_fc: str, the file path for the study area feature class.
     :param mmu: int, the minimum mapping unit.
     """
     # Create name for clipped feature class as a variable
-    clipped_patches = "clipped_patches"
+    clipped_patches = "memory\\clipped_patches"
 
     # Clip patches to study area
     arcpy.analysis.Clip(patches_fc, study_area_fc, clipped_patches)
@@ -42,30 +57,21 @@ def clip_patches(patches_fc, study_area_fc, mmu):
     # Calculate the area of the minimum mapping unit (Landsat imagery has 30-meter resolution)
     mmu_area = 30 * 30 * mmu
 
-    # Create a feature layer of the clipped patches
-    in_lyr = "in_layer"
-    arcpy.management.MakeFeatureLayer(clipped_patches, in_lyr)
-
-    # Select patches that are less than the MMU
-    arcpy.management.SelectLayerByAttribute(
-        in_lyr,
-        'NEW_SELECTION',
-        f'Shape_Area < {mmu_area}',
-        'NON_INVERT'
-    )
-
-    # Delete the features
-    arcpy.management.DeleteFeatures(in_lyr)
+    # Delete the patches that are less than the MMU, memory feature classes have no Shape_Area field to query, so
+    # the geometry area is checked for each patch
+    with arcpy.da.UpdateCursor(clipped_patches, ["SHAPE@AREA"]) as cursor:
+        for row in cursor:
+            if row[0] < mmu_area:
+                cursor.deleteRow()
 
-    # RENAME clipped_patches TO ORIGINAL patches_fc NAME
+    # REPLACE patches_fc WITH clipped_patches
     # Only patches_fc if it exists, which it should
     if arcpy.Exists(patches_fc):
         arcpy.Delete_management(patches_fc)
 
-    # Get the patches_fc name without the folder path
-    patches = os.path.basename(patches_fc)
-    # Rename the clipped features with the patches_fc name
-    arcpy.management.Rename(clipped_patches, patches, "FeatureClass")
+    # Copy the clipped features from memory to the patches_fc path and clean up memory
+    arcpy.management.CopyFeatures(clipped_patches, patches_fc)
+    arcpy.management.Delete(clipped_patches)
 
     # Update area and perim fields for clipped patches
     addAttrUtils.update_area_perim(patches_fc)
@@ -85,15 +91,7 @@ def add_utm_dd(fc, coord_type):
         geometry_property=f"UTMX {coord_type}_X;UTMY {coord_type}_Y",
         length_unit="",
         area_unit="",
-        coordinate_system='PROJCS["NAD_1983_UTM_Zone_10N",GEOGCS["GCS_North_American_1983",'
-                          'DATUM["D_North_American_1983",SPHEROID["GRS_1980",6378137.0,298.257222101]],'
-                          'PRIMEM["Greenwich",0.0],UNIT["Degree",0.0174532925199433]],'
-                          'PROJECTION["Transverse_Mercator"],'
-                          'PARAMETER["False_Easting",500000.0],'
-                          'PARAMETER["False_Northing",0.0],'
-                          'PARAMETER["Central_Meridian",-123.0],'
-                          'PARAMETER["Scale_Factor",0.9996],'
-                          'PARAMETER["Latitude_Of_Origin",0.0],UNIT["Meter",1.0]]',
+        coordinate_system=UTM10N_SR,
         coordinate_format="SAME_AS_INPUT"
     )
 
@@ -103,62 +101,52 @@ def add_utm_dd(fc, coord_type):
         geometry_property=f"Longitude {coord_type}_X;Latitude {coord_type}_Y",
         length_unit="",
         area_unit="",
-        coordinate_system='GEOGCS["GCS_North_American_1983",DATUM["D_North_American_1983",'
-                          'SPHEROID["GRS_1980",6378137.0,298.257222101]],'
-                          'PRIMEM["Greenwich",0.0],'
-                          'UNIT["Degree",0.0174532925199433]]',
+        coordinate_system=NAD83_SR,
         coordinate_format="DD"
     )
 
 
-def add_albers(fc, a_id=None, annual_ids=None):
+def add_albers(fc):
     """
     Add Albers coordinates to the patches. The default is "Central point" (INSIDE), but if that cannot be calculated,
     then "Centroid" is used. The annualIDs for any patches using "Centroid" are added to a list.
 
+    Calculate Geometry Attributes stops at the first patch where the central point cannot be calculated, so the
+    centroid is calculated for that patch, and the central point is calculated again for the remaining patches (higher
+    annualIDs). This is repeated until the central points for all remaining patches have been calculated.
+
     :param fc: str, the file path of the feature class to add the coordinates to.
-    :param annual_ids: list (optional), if this function is used recursively because a "centroid" needed to be
-    calculated instead of a "central point", the list of annualID(s) is an input, so it can be added to, if necessary.
-    :param a_id: int (optional), the annualID of the most recent patch where the "centroid" needed to be calculated
-    instead of the "central point".
     :return: list, if any patches required "centroid" instead of "central point", a list containing the annualID(s) for
-    the patch(es) is returned.
+    the patch(es) is returned, otherwise, None.
     """
+    # Initially set to None, a list is created if a centroid needs to be calculated
+    annual_ids = None
+
     # Find the maximum annualID
-    a_ids = [row[0] for row in arcpy.da.SearchCursor(fc, ["annualID"])]
-    max_aid = max(a_ids)
-
-    # If a_id was passed in, that means this function was called recursively, and we have to do things a little
-    # differently.
-    if a_id:
-        # Create a list for annualIDs with centroids if not passed in
-        if annual_ids is None:
-            annual_ids = []  # Initialize if it does not exist
-
-        # Add the annualID that was passed in to the list
-        annual_ids.append(a_id)
-
-        # If the a_id is the max annualID, we are finished adding Albers coordinates
-        if a_id == max_aid:
-            fc_name = os.path.basename(fc)
-            arcpy.AddWarning(f"The central point(s) could not be calculated for patch(es) from {fc_name} with "
-                             f"annualID(s) {annual_ids}. Centroid(s) calculated instead.")
-
-            return annual_ids
-
-        # Create a feature layer out of the feature class that was passed in
-        in_lyr = "in_layer"
-        arcpy.management.MakeFeatureLayer(fc, in_lyr)
-
-        # Select the features with annualIDs greater than the annualID passed in
-        arcpy.management.SelectLayerByAttribute(
-            in_lyr,
-            'NEW_SELECTION',
-            f'annualID > {a_id}',
-            'NON_INVERT'
-        )
+    max_aid = addAttrUtils.get_max_value(fc, "annualID")
 
-        # Attempt to calculate the central point
+    # Create one feature layer to calculate the coordinates with
+    in_lyr = "in_layer"
+    arcpy.management.MakeFeatureLayer(fc, in_lyr)
+
+    # Variables for the two field names we care about
+    field_id = "annualID"
+    field_coord = "X_Coord_m"
+
+    # annualID of the last patch where the centroid was calculated
+    a_id = None
+
+    while True:
+        # Only calculate central points for the patches after the last patch that needed a centroid
+        if a_id is not None:
+            arcpy.management.SelectLayerByAttribute(
+                in_lyr,
+                'NEW_SELECTION',
+                f'annualID > {a_id}',
+                'NON_INVERT'
+            )
+
+        # It is impossible to calculate the central point for some patches, which causes an error
         try:
             arcpy.management.CalculateGeometryAttributes(
                 in_features=in_lyr,
@@ -169,98 +157,50 @@ def add_albers(fc, a_id=None, annual_ids=None):
                 coordinate_format="SAME_AS_INPUT"
             )
 
-            return annual_ids
+            break
 
         # If an error occurs, the centroid will be calculated for that patch.
         except arcpy.ExecuteError:
-            # Variables for the two field names we care about
-            field_id = "annualID"
-            field_coord = "X_Coord_m"
-
-            # Go through each patch to find the one whose X_Coord_m is null
-            with arcpy.da.SearchCursor(fc, [field_id, field_coord]) as cursor:
-                for row in cursor:
-                    annual_id = row[0]
-                    x_coord = row[1]
-
-                    # The first feature where X_Coord_m is null is the one where the central point can't be calculated
-                    if x_coord is None:
-                        # Create a feature layer
-                        in_lyr = "in_layer"
-                        arcpy.management.MakeFeatureLayer(fc, in_lyr)
-
-                        # Select the culprit patch
-                        arcpy.management.SelectLayerByAttribute(
-                            in_lyr,
-                            'NEW_SELECTION',
-                            f'annualID = {annual_id}',
-                            'NON_INVERT'
-                        )
-
-                        # Calculate the culprit's centroid
-                        arcpy.management.CalculateGeometryAttributes(
-                            in_features=in_lyr,
-                            geometry_property="X_Coord_m CENTROID_X;Y_Coord_m CENTROID_Y",
-                            length_unit="",
-                            area_unit="",
-                            coordinate_system=None,
-                            coordinate_format="SAME_AS_INPUT"
-                        )
-
-                        # If annual_ids already exists, then we want to pass it in when we call this function, which
-                        # would be the case if this is not the first culprit patch.
-                        if annual_ids:
-                            annual_ids = add_albers(fc, annual_id, annual_ids)
-                        else:
-                            annual_ids = add_albers(fc, annual_id)
-    else:
-        # It is impossible to calculate the central point for some patches, which causes an error
-        try:
+            # The first feature where X_Coord_m is null is the one where the central point can't be calculated
+            # Only read the patches with a null X_Coord_m
+            with arcpy.da.SearchCursor(fc, [field_id], f"{field_coord} IS NULL") as cursor:
+                a_id = next(cursor, [None])[0]
+
+            # If no central points are missing, the error was not caused by a central point that can't be calculated
+            if a_id is None:
+                raise
+
+            # Select the culprit patch
+            arcpy.management.SelectLayerByAttribute(
+                in_lyr,
+                'NEW_SELECTION',
+                f'annualID = {a_id}',
+                'NON_INVERT'
+            )
+
+            # Calculate the culprit's centroid
             arcpy.management.CalculateGeometryAttributes(
-                in_features=fc,
-                geometry_property="X_Coord_m INSIDE_X;Y_Coord_m INSIDE_Y",
+                in_features=in_lyr,
+                geometry_property="X_Coord_m CENTROID_X;Y_Coord_m CENTROID_Y",
                 length_unit="",
                 area_unit="",
                 coordinate_system=None,
                 coordinate_format="SAME_AS_INPUT"
             )
 
-            return annual_ids
-        # If an error occurs, the centroid will be calculated for that patch (see comments for the same code above)
-        except arcpy.ExecuteError:
-            field_id = "annualID"
-            field_coord = "X_Coord_m"
-
-            # Go through each patch to find the one whose X_Coord_m is null
-            with arcpy.da.SearchCursor(fc, [field_id, field_coord]) as cursor:
-                for row in cursor:
-                    annual_id = row[0]
-                    x_coord = row[1]
-
-                    if x_coord is None:
-                        in_lyr = "in_layer"
-                        arcpy.management.MakeFeatureLayer(fc, in_lyr)
-
-                        arcpy.management.SelectLayerByAttribute(
-                            in_lyr,
-                            'NEW_SELECTION',
-                            f'annualID = {annual_id}',
-                            'NON_INVERT'
-                        )
-
-                        arcpy.management.CalculateGeometryAttributes(
-                            in_features=in_lyr,
-                            geometry_property="X_Coord_m CENTROID_X;Y_Coord_m CENTROID_Y",
-                            length_unit="",
-                            area_unit="",
-                            coordinate_system=None,
-                            coordinate_format="SAME_AS_INPUT"
-                        )
-
-                        if annual_ids:
-                            annual_ids = add_albers(fc, annual_id, annual_ids)
-                        else:
-                            annual_ids = add_albers(fc, annual_id)
+            # Add the annualID to the list, create the list if this is the first culprit patch
+            if annual_ids is None:
+                annual_ids = []
+            annual_ids.append(a_id)
+
+            # If the a_id is the max annualID, we are finished adding Albers coordinates
+            if a_id == max_aid:
+                break
+
+    if annual_ids is not None:
+        fc_name = os.path.basename(fc)
+        arcpy.AddWarning(f"The central point(s) could not be calculated for patch(es) from {fc_name} with "
+                         f"annualID(s) {annual_ids}. Centroid(s) calculated instead.")
 
     return annual_ids
 
@@ -273,112 +213,66 @@ def add_coords(fc):
 
     :param fc: str, the file path of the feature class to add the coordinates to.
     """
-    # Add the default coordinate type to the feature class
-    arcpy.management.AddField(
-        in_table=fc,
-        field_name="CoordType",
-        field_type="TEXT",
-        field_length=13,
-        field_is_nullable="NULLABLE"
-    )
-
-    arcpy.management.CalculateField(
+    # Add the coordinate type and UTM datum fields to the feature class
+    arcpy.management.AddFields(
         in_table=fc,
-        field="CoordType",
-        expression='"Central point"',
-        expression_type="PYTHON3"
+        field_description=addAttrUtils.field_descriptions(["CoordType", "Datum"], ["TEXT", "TEXT"], [13, 5])
     )
 
     # Add Albers coordinates and get a list of annualIDs where Centroid was used instead of Central point, if applicable
     annual_ids = add_albers(fc)
 
+    # Coordinate type is Centroid for the patches in annual_ids, otherwise, it's the default Central point
+    centroid_ids = set(annual_ids) if annual_ids is not None else set()
+
+    # Populate coordinate type and UTM datum in one pass
+    addAttrUtils.bulk_set(
+        fc,
+        {"CoordType": lambda row: "Centroid" if row["annualID"] in centroid_ids else "Central point",
+         "Datum": "NAD83"},
+        read_fields=["annualID"]
+    )
+
     # There are patches where Centroid was used
     if annual_ids is not None:
-        # Create a new layer
-        in_lyr = "in_layer"
-        arcpy.management.MakeFeatureLayer(fc, in_lyr)
-
-        # Convert list to a single string to use to Select by Attribute
-        annual_ids_str = ', '.join(map(str, annual_ids))
-        # Select patches with centroids using annualIDs
-        arcpy.management.SelectLayerByAttribute(
-            in_lyr,
-            'NEW_SELECTION',
-            f'annualID IN ({annual_ids_str})',
-            'NON_INVERT'
-        )
+        # Create a where clause (ranges and an IN list) to use in the layer definition queries
+        annual_ids_where = addAttrUtils.id_where_clause("annualID", annual_ids)
 
-        # Add centroid to coordinate type
-        arcpy.management.CalculateField(
-            in_table=in_lyr,
-            field="CoordType",
-            expression='"Centroid"',
-            expression_type="PYTHON3",
-            field_type="TEXT"
-        )
+        # Create a layer with only the patches with centroids and a layer with only the patches with central points
+        centroid_lyr = "centroid_lyr"
+        arcpy.management.MakeFeatureLayer(fc, centroid_lyr, annual_ids_where)
+        central_pt_lyr = "central_pt_lyr"
+        arcpy.management.MakeFeatureLayer(fc, central_pt_lyr, f"NOT {annual_ids_where}")
 
         # Add UTM and lat/long to patches with centroids
-        add_utm_dd(in_lyr, "CENTROID")
-
-        # Invert previous selection to get patches with Central points
-        arcpy.management.SelectLayerByAttribute(
-            in_lyr,
-            'NEW_SELECTION',
-            f'annualID IN ({annual_ids_str})',
-            'INVERT'
-        )
+        add_utm_dd(centroid_lyr, "CENTROID")
 
         # Add UTM and lat/long to patches with central points
-        add_utm_dd(in_lyr, "INSIDE")
+        add_utm_dd(central_pt_lyr, "INSIDE")
 
-        # Clear the selection
-        arcpy.management.SelectLayerByAttribute(in_lyr, 'CLEAR_SELECTION')
+        # Clean up the layers
+        arcpy.management.Delete([centroid_lyr, central_pt_lyr])
 
     else:
         # If no patches needed centroids, add UTM and lat/long using central point
         add_utm_dd(fc, "INSIDE")
 
-    # Add field for UTM datum and populate
-    arcpy.management.AddField(
-        in_table=fc,
-        field_name="Datum",
-        field_type="TEXT",
-        field_length=5,
-        field_is_nullable="NULLABLE"
-    )
 
-    arcpy.management.CalculateField(
-        in_table=fc,
-        field="Datum",
-        expression='"NAD83"',
-        expression_type="PYTHON3"
-    )
-
-
-def create_central_points(fc):
+def create_central_points(fc, zone_field):
     """
-    Creates a point feature class using the Albers coordinates added by add_coords().
+    Creates a point feature class using the Albers coordinates added by add_coords(). Only the coordinates and the zone
+    field are read from fc, so the other patch attributes are not copied to the points.
 
     :param fc: str, the file path of the feature class containing XY coordinates to turn into points.
-    :return: str, name of point feature class.
+    :param zone_field: str, the field containing the unique identifier.
+    :return: str, path of point feature class in memory.
     """
-    # Create a point feature class using X_Coord_m and Y_Coord_m
-    central_pts = "central_points"
-    arcpy.management.XYTableToPoint(
-        in_table=fc,
-        out_feature_class=central_pts,
-        x_field="X_Coord_m",
-        y_field="Y_Coord_m",
-        z_field=None,
-        coordinate_system='PROJCS["Albers",GEOGCS["GCS_North_American_1983",DATUM["D_North_American_1983",SPHEROID['
-                          '"GRS_1980",6378137.0,298.257222101]],PRIMEM["Greenwich",0.0],UNIT["Degree",'
-                          '0.0174532925199433]],PROJECTION["Albers"],PARAMETER["false_easting",0.0],PARAMETER['
-                          '"false_northing",0.0],PARAMETER["central_meridian",-96.0],PARAMETER['
-                          '"standard_parallel_1",'
-                          '29.5],PARAMETER["standard_parallel_2",45.5],PARAMETER["latitude_of_origin",23.0],'
-                          'UNIT["Meter",1.0]];-16901100 -6972200 266467840.990852;-100000 10000;-100000 '
-                          '10000;0.001;0.001;0.001;IsHighPrecision'
-    )
+    # Read only the zone field and coordinates into an array
+    arr = arcpy.da.FeatureClassToNumPyArray(fc, [zone_field, "X_Coord_m", "Y_Coord_m"])
+
+    # Create a point feature class using X_Coord_m and Y_Coord_m, only used to add attributes, so keep it in memory
+    central_pts = "memory\\central_points"
+    arcpy.da.NumPyArrayToFeatureClass(arr, central_pts, ("X_Coord_m", "Y_Coord_m"), ALBERS_SR)
 
     return central_pts
 
@@ -395,8 +289,9 @@ def add_attrs_points(
         zone_field):
     """
     Adds attributes (LandMgmt, Wilderness, InPark, InBuffer, Protected, Watershed, EastWest, if applicable) to
-    the central points feature class using functions from addAttrFunctions and addAttrUtils, then joins those fields to
-    the patches feature class. Returns nothing.
+    the patches feature class using the central points. The central points are tested against each polygon feature
+    class with addAttrUtils.polygon_values(), then all the attributes are written to the patches in one Update Cursor
+    pass using the zone field. Returns nothing.
 
     :param patches_fc: str, the file path to the patches feature class (single year).
     :param central_pts_sa: str, the file path of the patches central point/centroid feature class.
@@ -409,220 +304,98 @@ def add_attrs_points(
     :param watershed_fc: str, the file path to the HUC12 watershed feature class.
     :param zone_field: str, the field containing the unique identifier.
     """
-    # Add attributes
-    add_land_mgmt_wild(land_wild_fc, central_pts_sa)
-    add_watershed(watershed_fc, central_pts_sa)
-    addAttrUtils.select_calculate(central_pts_sa, park_fc, "INTERSECT", "InPark")
-    addAttrUtils.select_calculate(central_pts_sa, buff_fc, "INTERSECT", "InBuffer")
-
-    # Join the desired fields
-    arcpy.management.JoinField(
-        in_data=patches_fc,
-        in_field=zone_field,
-        join_table=central_pts_sa,
-        join_field=zone_field,
-        fields=["WildName", "LandMgmt", "Watershed", "InPark", "InBuffer"],
-        fm_option="NOT_USE_FM",
-        field_mapping=None,
-        index_join_fields="NO_INDEXES"
+    # Find the MANAGER and WildName of the land management polygon each point is completely within
+    land_wild = addAttrUtils.polygon_values(
+        central_pts_sa, zone_field, land_wild_fc, ["MANAGER", "WildName"], "COMPLETELY_WITHIN"
     )
-
-    # Get a list of existing fields
-    existing_fields = [field.name for field in arcpy.ListFields(central_pts_sa)]
+    # Find the NAME of the watershed each point is in
+    watersheds = addAttrUtils.polygon_values(central_pts_sa, zone_field, watershed_fc, ["NAME"], "INTERSECT")
+    # Find the points in the park and in the buffer
+    in_park = addAttrUtils.polygon_values(central_pts_sa, zone_field, park_fc, [], "INTERSECT")
+    in_buff = addAttrUtils.polygon_values(central_pts_sa, zone_field, buff_fc, [], "INTERSECT")
 
     # LEWI does not have protected areas or crest (east west)
-    # Create fields and leave null
+    # Leave fields null
     if protected_fc is None or east_west_fc is None:
-        # If fields do not already exist, add them
-        if "Protected" not in existing_fields:
-            arcpy.management.AddField(
-                in_table=central_pts_sa,
-                field_name="Protected",
-                field_type="SHORT",
-                field_is_nullable="NULLABLE"
-            )
-
-        if "EastWest" not in existing_fields:
-            arcpy.management.AddField(
-                in_table=central_pts_sa,
-                field_name="EastWest",
-                field_type="TEXT",
-                field_length=4,
-                field_is_nullable="NULLABLE"
-            )
+        protected = None
+        east_west = {}
     else:
         # Add attributes to the rest of the parks
-        addAttrUtils.select_calculate(central_pts_sa, protected_fc, "INTERSECT", "Protected")
-
-        if "EastWest" in existing_fields:
-            # Delete original field, so it can be added with the spatial join and join field
-            arcpy.management.DeleteField(
-                in_table=central_pts_sa,
-                drop_field="EastWest"
-            )
+        protected = addAttrUtils.polygon_values(central_pts_sa, zone_field, protected_fc, [], "INTERSECT")
+        east_west = addAttrUtils.polygon_values(central_pts_sa, zone_field, east_west_fc, ["EastWest"], "INTERSECT")
 
-            arcpy.management.DeleteField(
-                in_table=patches_fc,
-                drop_field="EastWest"
-            )
-
-        # Add EastWest
-        arcpy.management.AddSpatialJoin(
-            target_features=central_pts_sa,
-            join_features=east_west_fc,
-            join_operation="JOIN_ONE_TO_ONE",
-            join_type="KEEP_ALL",
-            field_mapping=f'EastWest "EastWest" true true false 4 Text 0 0,First,#,{east_west_fc},EastWest,0,3',
-            match_option="INTERSECT",
-            search_radius=None,
-            distance_field_name="",
-            permanent_join="PERMANENT_FIELDS",
-            match_fields=None
-        )
-
-    # Determine which fields to join by comparing existing fields in patches_fc
-    # Only want to join fields that do not already exist
-    join_fields = [field for field in ["Protected", "EastWest"] if field not in existing_fields]
-
-    # Only join fields if there are fields to join
-    if join_fields:
-        arcpy.management.JoinField(
-            in_data=patches_fc,
-            in_field=zone_field,
-            join_table=central_pts_sa,
-            join_field=zone_field,
-            fields=join_fields,
-            fm_option="NOT_USE_FM",
-            field_mapping=None,
-            index_join_fields="NO_INDEXES"
+    # Add all the fields at once, they were deleted by del_existing_fields() if they already existed
+    fields = ["WildName", "LandMgmt", "Watershed", "InPark", "InBuffer", "Protected", "EastWest"]
+    arcpy.management.AddFields(
+        in_table=patches_fc,
+        field_description=addAttrUtils.field_descriptions(
+            fields,
+            ["TEXT", "TEXT", "TEXT", "SHORT", "SHORT", "SHORT", "TEXT"],
+            [100, 50, 50, None, None, None, 4]
         )
-
-    # Clean up GDB
-    arcpy.management.Delete(central_pts_sa)
-
-
-def add_land_mgmt_wild(lmw_fc, pts):
-    """
-    Adds LandMgmt and WildName attributes to the patches central points. Returns nothing.
-
-    :param lmw_fc: str, the file path to the feature class containing the land management and wilderness
-    names.
-    :param pts: str, the file path of the point feature class to add attributes to.
-    """
-    # Join MANAGER, and WildName from lmw_fc to the points
-    # Field mapping for join
-    fm = (f'MANAGER "MANAGER" true true false 100 Text 0 0,First,#,{lmw_fc},MANAGER,0,99;'
-          f'WildName "WildName" true true false 100 Text 0 0,First,#,{lmw_fc},WildName,0,99')
-
-    arcpy.management.AddSpatialJoin(
-        target_features=pts,
-        join_features=lmw_fc,
-        join_operation="JOIN_ONE_TO_ONE",
-        join_type="KEEP_ALL",
-        field_mapping=fm,
-        match_option="COMPLETELY_WITHIN",
-        search_radius=None,
-        distance_field_name="",
-        permanent_join="PERMANENT_FIELDS",
-        match_fields=None
     )
 
-    addAttrUtils.rename_field(pts, "MANAGER", "LandMgmt", "TEXT", 50)
-
-
-def add_watershed(watershed_fc, pts):
-    """
-    Add Watershed attribute to the patches central points. Returns nothing.
-
-    :param watershed_fc: str, the file path to the HUC12 watershed feature class.
-    :param pts: str, the file path of the point feature class to add attributes to.
-    """
-    # Join NAME to central points
-    # Field mapping for join
-    fm = f'NAME "NAME" true true false 120 Text 0 0,First,#,{watershed_fc},NAME,0,119'
-
-    arcpy.management.AddSpatialJoin(
-        target_features=pts,
-        join_features=watershed_fc,
-        join_operation="JOIN_ONE_TO_ONE",
-        join_type="KEEP_ALL",
-        field_mapping=fm,
-        match_option="INTERSECT",
-        search_radius=None,
-        distance_field_name="",
-        permanent_join="PERMANENT_FIELDS",
-        match_fields=None
-    )
-
-    addAttrUtils.rename_field(pts, "NAME", "Watershed", "TEXT", 50)
+    # Populate all the fields for each patch using the values found for its central point
+    with arcpy.da.UpdateCursor(patches_fc, [zone_field] + fields) as cursor:
+        for row in cursor:
+            key = row[0]
+            land_mgmt, wild_name = land_wild.get(key, (None, None))
+            row[1:] = [
+                wild_name,
+                land_mgmt,
+                watersheds.get(key, (None,))[0],
+                int(key in in_park),
+                int(key in in_buff),
+                int(key in protected) if protected is not None else None,
+                east_west.get(key, (None,))[0]
+            ]
+            cursor.updateRow(row)
+
+    # Clean up memory
+    arcpy.management.Delete(central_pts_sa)
 
 
 def add_veg_type(fc, veg_raster, zone_field, veg_type_tbl):
     """
     Adds VegType attribute using Zonal Statistics to find the majority veg type within the patch. Uses the veg type
-    lookup table with VegValue (converted to an integer) to add VegCode attribute. If the park is LEWI, no veg type
-    looku table is needed; the VegCode is calculated using the VegValue. Returns nothing.
+    lookup table (read into a dictionary) with VegValue (converted to an integer) to add VegCode attribute. If the park
+    is LEWI, no veg type looku table is needed; the VegCode is calculated using the VegValue. Returns nothing.
 
     :param fc: str, the file path of the feature class to add the attributes to.
     :param veg_raster: str, the file path to the vegetation raster containing the MCID/value for the vegetation types.
     :param zone_field: str, the field containing the unique identifier.
     :param veg_type_tbl: str, file path to the table containing the MCID and vegetations codes for the park.
     """
-    # Find majority VegValue and add to patches
+    # Find majority VegValue and add to patches, only the part of the veg raster under the patches is read
     addAttrUtils.zonal_stats_rename_field(fc, veg_raster, zone_field, "MAJORITY", "Veg_value_text", "TEXT")
 
-    # Convert Veg_value to long for join
-    arcpy.management.CalculateField(
-        in_table=fc,
-        field="VegValue",
-        expression="int(!Veg_value_text!) if !Veg_value_text! else None",
-        expression_type="PYTHON3",
-        field_type="LONG"
-    )
-
-    arcpy.management.DeleteField(
+    # Add VegValue and VegCode fields
+    arcpy.management.AddFields(
         in_table=fc,
-        drop_field="Veg_value_text"
+        field_description=addAttrUtils.field_descriptions(["VegValue", "VegCode"], ["LONG", "TEXT"], [None, 4])
     )
 
     # LEWI does not have a veg type lookup table, but the rest of the parks do
     if veg_type_tbl:
-        # Join the CODE associated with the Veg_value (MCID)
-        arcpy.management.JoinField(
-            in_data=fc,
-            in_field="VegValue",
-            join_table=veg_type_tbl,
-            join_field="MCID",
-            fields="CODE",
-            fm_option="NOT_USE_FM",
-            field_mapping=None,
-            index_join_fields="NO_INDEXES"
-        )
-
-        addAttrUtils.rename_field(fc, "CODE", "VegCode", "TEXT", 4)
+        # Read the CODE associated with each Veg_value (MCID) from the lookup table once
+        codes = dict(arcpy.da.SearchCursor(veg_type_tbl, ["MCID", "CODE"]))
     else:
-        # Add VegCode field
-        arcpy.management.AddField(
-            in_table=fc,
-            field_name="VegCode",
-            field_type="TEXT",
-            field_length=4,
-            field_is_nullable="NULLABLE"
-        )
+        codes = None
+
+    # Convert Veg_value to long and look up the VegCode in one pass, LEWI VegCode is created from the VegValue
+    with arcpy.da.UpdateCursor(fc, ["Veg_value_text", "VegValue", "VegCode"]) as cursor:
+        for row in cursor:
+            veg_value = int(row[0]) if row[0] else None
+            if codes is not None:
+                veg_code = codes.get(veg_value)
+            else:
+                veg_code = f"L{veg_value:02d}" if veg_value is not None else None
+            cursor.updateRow([row[0], veg_value, veg_code])
 
-        # Calculate LEWI VegCode
-        arcpy.management.CalculateField(
-            in_table=fc,
-            field="VegCode",
-            expression="create_code(!VegValue!)",
-            expression_type="PYTHON3",
-            code_block="""def create_code(id):
-                if id < 10:
-                    code = "L0" + str(id)
-                else:
-                    code = "L" + str(id)
-                return code"""
-        )
+    arcpy.management.DeleteField(
+        in_table=fc,
+        drop_field="Veg_value_text"
+    )
 
 
 def add_zonal_geometry(fc, zone_field, pro_cell_size):
@@ -635,7 +408,7 @@ def add_zonal_geometry(fc, zone_field, pro_cell_size):
     :param pro_cell_size: int, the processing cell size for Zonal Geometry as Table.
     """
     # Create table name
-    zonal_geo_tbl = "zonal_geo_tbl"
+    zonal_geo_tbl = "memory\\zonal_geo_tbl"
 
     # Run Zonal Geometry as Table
     arcpy.sa.ZonalGeometryAsTable(
@@ -647,7 +420,7 @@ def add_zonal_geometry(fc, zone_field, pro_cell_size):
 
     # Keep field names as-is when joining zonal geometry fields to patches
     arcpy.env.qualifiedFieldNames = False
-    # Join the desired zonal geometry fields to the patches
+    # Join the desired zonal geometry fields to the patches, indexing the join fields
     arcpy.management.JoinField(
         in_data=fc,
         in_field=zone_field,
@@ -656,16 +429,17 @@ def add_zonal_geometry(fc, zone_field, pro_cell_size):
         fields="THICKNESS;MAJORAXIS;MINORAXIS;ORIENTATION",
         fm_option="NOT_USE_FM",
         field_mapping=None,
-        index_join_fields="NO_INDEXES"
+        index_join_fields="NEW_INDEXES"
     )
 
-    # Clean up GDB
+    # Clean up memory
     arcpy.management.Delete(zonal_geo_tbl)
 
 
 def add_park_patch_name(changeDB_fc, park, mmu, start_yr, end_yr):
     """
-    Adds park and patch name attributes to the patches feature class by calculating the fields. Returns nothing.
+    Adds park and patch name attributes to the patches feature class, populating both fields with an Update Cursor.
+    Returns nothing.
 
     :param changeDB_fc: str, the file path of the feature class containing patches for the entire run (all years).
     :param park: str, the park code.
@@ -673,46 +447,29 @@ def add_park_patch_name(changeDB_fc, park, mmu, start_yr, end_yr):
     :param end_yr: int, the max year in changeDB_fc.
     :param start_yr: int, the min year in changeDB_fc.
     """
-    # Add Park field
-    arcpy.management.AddField(
-        in_table=changeDB_fc,
-        field_name="Park",
-        field_type="TEXT",
-        field_length=4,
-        field_is_nullable="NULLABLE"
-    )
-
-    # Populate with Park code
-    arcpy.management.CalculateField(
+    # Add Park and PatchName fields
+    arcpy.management.AddFields(
         in_table=changeDB_fc,
-        field="Park",
-        expression=f'"{park}"',
-        expression_type="PYTHON3"
+        field_description=addAttrUtils.field_descriptions(["Park", "PatchName"], ["TEXT", "TEXT"], [4, 50])
     )
 
-    # Add PatchName field
-    arcpy.management.AddField(
-        in_table=changeDB_fc,
-        field_name="PatchName",
-        field_type="TEXT",
-        field_length=50,
-        field_is_nullable="NULLABLE"
-    )
+    # Format the parts of the patch name shared by all patches once
+    prefix = f"{park}_{mmu}_"
+    mid = f"_{start_yr}_{end_yr}_"
 
-    # Calculate PatchName
-    arcpy.management.CalculateField(
-        in_table=changeDB_fc,
-        field="PatchName",
-        expression=f'"{park}_{mmu}_" + !index! + "_{start_yr}_{end_yr}_" + str(!yod!) + "_" + str(!annualID!)',
-        expression_type="PYTHON3"
-    )
+    # Populate with Park code and PatchName in one pass
+    with arcpy.da.UpdateCursor(changeDB_fc, ["index", "yod", "annualID", "Park", "PatchName"]) as cursor:
+        for row in cursor:
+            row[3] = park
+            row[4] = f"{prefix}{row[0]}{mid}{row[1]}_{row[2]}"
+            cursor.updateRow(row)
 
 
 def add_overlap_prev(base_fc, prev_fc, park, events_mask):
     """
     Adds OverlapPrv attribute to patches feature class. Initally, OverlapPrv is set to 0/False. Then the base_fc
-    patches that overlap (intersect) with the prev_fc patches are selected, and OverlapPrv is set to 1/True. Returns
-    nothing.
+    patches that overlap (intersect) with the prev_fc patches are selected, and OverlapPrv is set to 1/True for the
+    selected patches with an Update Cursor. Returns nothing.
 
     :param base_fc: str, the file path of the patches for the current year.
     :param prev_fc: str, the file path of the patches for the previous year.
@@ -720,6 +477,10 @@ def add_overlap_prev(base_fc, prev_fc, park, events_mask):
     :param events_mask: Boolean, indicates whether event fields are populated for patches inside water and/or elevation
     mask.
     """
+    # Make sure both years have a spatial index for the overlap selection
+    addAttrUtils.add_spatial_index(base_fc)
+    addAttrUtils.add_spatial_index(prev_fc)
+
     # Create layer names
     base_lyr = "base_lyr"
     prev_lyr = "prev_lyr"
@@ -747,37 +508,32 @@ def add_overlap_prev(base_fc, prev_fc, park, events_mask):
         invert_spatial_relationship="NOT_INVERT"
     )
 
-    # Set OverlapPrv to 1/True for selected patches
-    arcpy.management.CalculateField(
-        in_table=base_lyr,
-        field="OverlapPrv",
-        expression="1",
-        expression_type="PYTHON3",
-    )
+    # Set OverlapPrv to 1/True for selected patches in one cursor pass, the cursor only reads the selected patches,
+    # but it would read all patches if none are selected, so skip it when nothing overlaps
+    if arcpy.Describe(base_lyr).FIDSet:
+        with arcpy.da.UpdateCursor(base_lyr, ["OverlapPrv"]) as cursor:
+            for _ in cursor:
+                cursor.updateRow([1])
+
+    # Clean up memory
+    arcpy.management.Delete([base_lyr, prev_lyr])
 
 
 def add_paratio(patches_fc):
     """
-    Adds paratio to patches feature class by performing a calculation using area and perim. Returns nothing.
+    Adds paratio to patches feature class by performing a calculation using area and perim. The calculation is done on
+    a NumPy array of area and perim, and paratio is added with Extend Table. Returns nothing.
 
     :param patches_fc: str, the file path of the feature class to add the attributes to.
     """
-    # Add field and calculate
-    arcpy.management.AddField(
-        in_table=patches_fc,
-        field_name="paratio",
-        field_type="DOUBLE",
-        field_precision=16,
-        field_scale=15,
-        field_length=None,
-        field_alias="",
-        field_is_nullable="NULLABLE",
-        field_is_required="NON_REQUIRED",
-        field_domain=""
-    )
-    arcpy.management.CalculateField(
-        in_table=patches_fc,
-        field="paratio",
-        expression=f'!area! /  ((0.282 * !perim!)**2)',
-        expression_type="PYTHON3"
-    )
+    # Read area and perim into an array
+    oid_field = arcpy.Describe(patches_fc).OIDFieldName
+    arr = arcpy.da.FeatureClassToNumPyArray(patches_fc, ["OID@", "area", "perim"])
+
+    # Calculate paratio for all patches at once
+    paratio = np.empty(arr.size, dtype=[("OID", "<i4"), ("paratio", "<f8")])
+    paratio["OID"] = arr["OID@"]
+    paratio["paratio"] = arr["area"] / ((0.282 * arr["perim"]) ** 2)
+
+    # Add paratio (DOUBLE) to the patches
+    arcpy.da.ExtendTable(patches_fc, oid_field, paratio, "OID", append_only=False)
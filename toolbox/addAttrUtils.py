@@ -1,14 +1,49 @@
 """
 Functions to support adding attributes to patches and other processes.
 * set_default_gdb_workspace()
-* rename_field()
+* field_descriptions()
+* field_converter()
 * select_calculate()
+* select_ids()
+* zones_to_raster()
+* clip_raster_to_fc()
 * zonal_stats_rename_field()
+* zonal_stats_many()
+* zonal_stats_numpy()
+* rasters_aligned()
 * del_existing_fields()
 * del_select_patches()
+* append_patches()
+* get_workspace()
 * update_area_perim()
+* add_spatial_index()
+* id_where_clause()
+* get_max_value()
+* get_min_max_values()
+* bulk_set()
+* read_polygons()
+* polygon_grid()
+* grid_candidates()
+* polygon_values()
+* match_polygon()
 """
+import functools
+import os
 import arcpy
+import numpy as np
+
+# Zonal statistics that zonal_stats_rename_field() calculates with NumPy when a zone raster is provided, the rest use
+# Zonal Statistics as Table
+NUMPY_STAT_TYPES = ("MEAN", "SUM", "MINIMUM", "MAXIMUM")
+
+# Number of cells that clip_raster_to_fc() adds on each side of the feature class extent before clipping a raster
+CLIP_PAD_CELLS = 2
+
+# Fraction of a cell that the cell sizes and cell edges of two rasters can differ by and still be treated as aligned
+CELL_ALIGN_TOLERANCE = 1e-6
+
+# Largest number of cells along each side of the grid that polygon_grid() builds to find candidate polygons
+GRID_MAX_CELLS = 128
 
 
 def set_default_gdb_workspace():
@@ -29,170 +64,374 @@ def set_default_gdb_workspace():
     return default_gdb
 
 
-def rename_field(fc, old_fields, new_fields, field_types=None, field_lengths=None):
+def field_descriptions(field_names, field_types, field_lengths=None):
     """
-    Renames fields in a feature class by creating a new field, copying values from old field, and deleting old field.
-    Returns nothing.
+    Creates the field description list used by Add Fields, so several fields can be added to a feature class with one
+    schema change.
 
-    :param fc: str, the file path of the feature class with fields to rename.
-    :param old_fields: list, existing field names to be renamed.
-    :param new_fields: list, new field names to rename existing field with.
-    :param field_lengths:
-    :param field_types:
+    :param field_names: list, the names of the fields to add.
+    :param field_types: list, the field types of the fields to add.
+    :param field_lengths: list (optional), the field lengths of the fields to add; None for fields that are not TEXT.
+    :return: list, the field descriptions ([name, type, alias, length]) for Add Fields.
     """
-    # If inputs are not a list, turn them into a list
-    if not isinstance(old_fields, list):
-        old_fields = [old_fields]
-        new_fields = [new_fields]
-        field_types = [field_types]
-        field_lengths = [field_lengths]
+    if field_lengths is None:
+        field_lengths = [None] * len(field_names)
 
-    # Iterate through each field
-    for i in range(len(old_fields)):
-        # Add a new field with the appropriate field type and length, if applicable
-        arcpy.management.AddField(
-            in_table=fc,
-            field_name=new_fields[i],
-            field_type=field_types[i],
-            field_length=field_lengths[i],
-            field_is_nullable="NULLABLE"
-        )
+    # Alias is left blank, so it is the same as the field name
+    return [[name, ftype, "", length if length is not None else ""]
+            for name, ftype, length in zip(field_names, field_types, field_lengths)]
 
-        # Populate with old_field values to basically change the field name
-        arcpy.management.CalculateField(
-            in_table=fc,
-            field=new_fields[i],
-            expression=f"!{old_fields[i]}!",
-            expression_type="PYTHON3",
-        )
 
-    # Delete old field(s)
-    arcpy.management.DeleteField(
-        in_table=fc,
-        drop_field=old_fields
-    )
+def field_converter(field_type):
+    """
+    Gets the function used to convert values before they are written to a field with a cursor, so the values are
+    converted the same way Calculate Field would convert them.
+
+    :param field_type: str, the field type, as used by Add Field (e.g., TEXT) or as returned by List Fields (e.g.,
+    String).
+    :return: function, str for text fields, round for integer fields, or None if the values do not need to be converted.
+    """
+    if field_type in ("TEXT", "String"):
+        return str
+    if field_type in ("SHORT", "LONG", "BIGINTEGER", "SmallInteger", "Integer", "BigInteger"):
+        return round
+
+    return None
 
 
 def select_calculate(in_fc, select_fc, relationship, field):
     """
-    Selects input point features that intersects the selecting polygon features and populates the desired field with
-    1 (True), inverts the selection, and populates the field with 0 (False). Returns nothing.
+    Finds the input features that intersect (INTERSECT) or are completely within (COMPLETELY_WITHIN) the selecting
+    polygon features with select_ids() and populates the desired field with 1 (True), and 0 (False) for the rest of the
+    features, with one Update Cursor pass. Returns nothing.
 
-    :param in_fc: str, the file path to the input point feature class to add the field to and populate using the
-    selecting polygon feature class.
+    :param in_fc: str, the file path to the input feature class (or a feature layer of it) to add the field to
+    and populate using the selecting polygon feature class.
     :param select_fc: str, the file path to the selecting polygon feature class used to select features in the input
-    point feature class.
-    features
+    feature class.
     :param relationship: str, the type of selection relationship between input and selecting features.
     :param field: str, the name of the field to create and populate.
     """
+    # Add the field if it does not already exist
+    if not arcpy.ListFields(in_fc, field):
+        arcpy.management.AddField(
+            in_table=in_fc,
+            field_name=field,
+            field_type="SHORT",
+            field_is_nullable="NULLABLE"
+        )
+
+    # Find the features that match the selecting polygons
+    selected = select_ids(in_fc, select_fc, relationship)
+
+    # Populate 1/True for the matching features and 0/False for the rest without touching the geometry
+    with arcpy.da.UpdateCursor(in_fc, ["OID@", field]) as cursor:
+        for row in cursor:
+            cursor.updateRow([row[0], int(row[0] in selected)])
+
+
+def select_ids(in_fc, select_fc, relationship):
+    """
+    Selects the input features that are completely within (COMPLETELY_WITHIN) or intersect (INTERSECT) the selecting
+    features with Select Layer By Location, which uses the spatial index of the geodatabase.
+
+    :param in_fc: str, the file path to the input feature class (or a feature layer of it) to select features from.
+    :param select_fc: str, the file path to the selecting feature class.
+    :param relationship: str, the type of selection relationship between input and selecting features.
+    :return: set, the object IDs of the selected input features.
+    """
     # Create a layer so features can be selected
-    in_lyr = "in_layer"
+    in_lyr = "select_ids_layer"
     arcpy.management.MakeFeatureLayer(in_fc, in_lyr)
-    select_lyr = "select_layer"
-    arcpy.management.MakeFeatureLayer(select_fc, select_lyr)
-
-    # Select point features that intersect polygon features and add 1/True to field
-    arcpy.management.SelectLayerByLocation(
-        in_layer=in_lyr,
-        overlap_type=f"{relationship}",
-        select_features=select_lyr,
-        search_distance=None,
-        selection_type="NEW_SELECTION",
-        invert_spatial_relationship="NOT_INVERT"
-    )
 
-    arcpy.management.CalculateField(
-        in_table=in_lyr,
-        field=field,
-        expression='1',
-        expression_type="PYTHON3",
-        field_type="SHORT"
-    )
+    try:
+        arcpy.management.SelectLayerByLocation(
+            in_layer=in_lyr,
+            overlap_type=relationship,
+            select_features=select_fc,
+            search_distance=None,
+            selection_type="NEW_SELECTION",
+            invert_spatial_relationship="NOT_INVERT"
+        )
 
-    # Invert selection and add 0/False to field
-    arcpy.management.SelectLayerByLocation(
-        in_layer=in_lyr,
-        overlap_type=f"{relationship}",
-        select_features=select_lyr,
-        search_distance=None,
-        selection_type="NEW_SELECTION",
-        invert_spatial_relationship="INVERT"
-    )
+        # Read the selection set, it is empty if no features were selected
+        fid_set = arcpy.Describe(in_lyr).FIDSet
+        return {int(oid) for oid in fid_set.split(";")} if fid_set else set()
+    finally:
+        arcpy.management.Delete(in_lyr)
 
-    arcpy.management.CalculateField(
-        in_table=in_lyr,
-        field=field,
-        expression='0',
-        expression_type="PYTHON3",
-        field_type="SHORT"
+
+def zones_to_raster(fc, zone_field, snap_rst):
+    """
+    Converts the patches to a zone raster that is aligned with (same cell size and snapped to) the value raster, so the
+    zones only need to be rasterized once when they are used for more than one Zonal Statistics as Table. The cell
+    values of the zone raster are the zone field values.
+
+    :param fc: str, the file path of the feature class to convert to a zone raster.
+    :param zone_field: str, the field name of the feature class unique identifier.
+    :param snap_rst: str, the file path of the value raster to align the zone raster with.
+    :return: str, the path of the zone raster in memory.
+    """
+    zones_rst = "memory\\zones_rst"
+
+    # Snap to the value raster, the same as when zonal stats rasterizes the zones itself
+    with arcpy.EnvManager(snapRaster=snap_rst):
+        arcpy.conversion.PolygonToRaster(
+            in_features=fc,
+            value_field=zone_field,
+            out_rasterdataset=zones_rst,
+            cell_assignment="CELL_CENTER",
+            cellsize=snap_rst
+        )
+
+    return zones_rst
+
+
+def clip_raster_to_fc(rst, fc, out_rst):
+    """
+    Clips a raster to the extent of a feature class, so zonal statistics only read the part of the raster that is
+    under the patches. The extent is expanded by CLIP_PAD_CELLS cells on each side, so the cells along the edges of the
+    patches are kept even though the projected extent is not exact. The cells are not resampled, so the clipped raster
+    stays aligned with the original raster.
+
+    :param rst: str, the file path of the raster to clip.
+    :param fc: str, the file path of the feature class whose extent is used to clip the raster.
+    :param out_rst: str, the path of the clipped raster (e.g., in memory).
+    :return: str, the path of the clipped raster.
+    """
+    # Get the extent of the feature class in the spatial reference of the raster
+    rst_desc = arcpy.Describe(rst)
+    extent = arcpy.Describe(fc).extent.projectAs(rst_desc.spatialReference)
+
+    # Expand the extent by a few cells
+    pad_x = rst_desc.meanCellWidth * CLIP_PAD_CELLS
+    pad_y = rst_desc.meanCellHeight * CLIP_PAD_CELLS
+
+    arcpy.management.Clip(
+        in_raster=rst,
+        rectangle=f"{extent.XMin - pad_x} {extent.YMin - pad_y} {extent.XMax + pad_x} {extent.YMax + pad_y}",
+        out_raster=out_rst,
+        clipping_geometry="NONE",
+        maintain_clipping_extent="NO_MAINTAIN_EXTENT"
     )
 
+    return out_rst
+
 
-def zonal_stats_rename_field(fc, rst, zone_field, stat_type, field_name, field_type):
+def zonal_stats_rename_field(fc, rst, zone_field, stat_type, field_name, field_type, add_field=True, zones_rst=None):
     """
-    Runs Zonal Statistics as Table for the statistics type specified, then joins that field to the feature class. The
-    field is renamed to the desired field name. Zonal Statistics table is deleted. Returns nothing.
+    Runs Zonal Statistics as Table for the statistics type specified, then reads the statistic for each zone into a
+    dictionary and writes it to the desired field with an Update Cursor. Zonal Statistics table is deleted. The raster
+    is clipped to the extent of the feature class first, unless a zone raster is provided. If a zone raster is
+    provided, the statistics in NUMPY_STAT_TYPES are calculated by zonal_stats_numpy() instead, as long as
+    rasters_aligned() finds that the zone raster and the raster line up. Returns nothing.
 
     :param fc: str, the file path of the feature class to add zonal stats field to.
     :param rst: str, the file path of the raster that will provide the stats.
     :param zone_field: str, the field name of the feature class unique identifier.
     :param stat_type: str, the zonal statistic to calculate.
     :param field_name: str, the desired name of the zonal stats field.
-    :param field_type:
+    :param field_type: str, the field type of the zonal stats field.
+    :param add_field: Boolean (optional), whether to add the zonal stats field; False if it was already added.
+    :param zones_rst: str (optional), zone raster from zones_to_raster() to use instead of rasterizing the feature class.
     """
-    # Check the spatial reference and project the raster if necessary
-    if arcpy.Describe(fc).spatialReference.name != arcpy.Describe(rst).spatialReference.name:
-        proj_raster = "proj_raster"
-
-        arcpy.management.ProjectRaster(
-            in_raster=rst,
-            out_raster=proj_raster,
-            out_coor_system=arcpy.Describe(fc).spatialReference,
-            resampling_type="NEAREST"
-        )
+    # Get the spatial references to check if the raster needs to be projected
+    fc_sr = arcpy.Describe(fc).spatialReference
+    rst_sr = arcpy.Describe(rst).spatialReference
+
+    # Intermediate rasters are kept in memory and deleted even if the stats fail
+    clip_raster = None
+    proj_raster = None
+    try:
+        # Only read the part of the raster under the features, a zone raster already limits the stats to its extent,
+        # but the raster is still clipped before it is projected
+        if zones_rst is None or fc_sr.name != rst_sr.name:
+            clip_raster = clip_raster_to_fc(rst, fc, "memory\\clip_raster")
+            rst = clip_raster
+
+        # Project the raster if necessary
+        if fc_sr.name != rst_sr.name:
+            proj_raster = "memory\\proj_raster"
+
+            arcpy.management.ProjectRaster(
+                in_raster=rst,
+                out_raster=proj_raster,
+                out_coor_system=fc_sr,
+                resampling_type="NEAREST"
+            )
+
+            rst = proj_raster
+
+        # Simple statistics are calculated from the zone raster and value raster cells with NumPy, only if the value
+        # raster was not projected and its cells are aligned with the zone raster
+        if (zones_rst is not None and proj_raster is None and stat_type in NUMPY_STAT_TYPES and
+                rasters_aligned(zones_rst, rst)):
+            zone_stats = zonal_stats_numpy(zones_rst, rst, stat_type)
+        else:
+            # Define the table
+            zonal_stats_tbl = "memory\\zonal_stats_tbl"
+
+            # Use the zone raster if there is one, the zone field values are in the raster Value field
+            if zones_rst is not None:
+                in_zone_data = zones_rst
+                stats_zone_field = "Value"
+            else:
+                in_zone_data = fc
+                stats_zone_field = zone_field
+
+            # Run Zonal Statistics As Table
+            arcpy.ia.ZonalStatisticsAsTable(
+                in_zone_data=in_zone_data,
+                zone_field=stats_zone_field,
+                in_value_raster=rst,
+                out_table=zonal_stats_tbl,
+                ignore_nodata="DATA",
+                statistics_type=stat_type,
+                process_as_multidimensional="CURRENT_SLICE",
+                percentile_values=[90],
+                percentile_interpolation_type="AUTO_DETECT",
+                circular_calculation="ARITHMETIC",
+                circular_wrap_value=360
+            )
+
+            # Read the statistic for each zone, the table only has one row per zone
+            with arcpy.da.SearchCursor(zonal_stats_tbl, [stats_zone_field, stat_type]) as cursor:
+                zone_stats = dict(cursor)
+
+            # Clean up memory
+            arcpy.management.Delete(zonal_stats_tbl)
+
+        if add_field:
+            arcpy.management.AddField(
+                in_table=fc,
+                field_name=field_name,
+                field_type=field_type,
+                field_is_nullable="NULLABLE"
+            )
+
+        # Populate the field in one pass, converting the stats to the field type, patches without stats are left
+        # null
+        convert = field_converter(field_type)
+        with arcpy.da.UpdateCursor(fc, [zone_field, field_name]) as cursor:
+            for row in cursor:
+                value = zone_stats.get(row[0])
+                if convert is not None and value is not None:
+                    value = convert(value)
+                cursor.updateRow([row[0], value])
+    finally:
+        # Clean up memory
+        for intermediate in (proj_raster, clip_raster):
+            if intermediate is not None:
+                arcpy.management.Delete(intermediate)
+
+
+def zonal_stats_many(fc, rasters, zone_field, stat_types, field_names, field_types):
+    """
+    Runs zonal_stats_rename_field() for several aligned rasters (same cell size and snapping) that share the same
+    zones. All the fields are added with one schema change and the zones are rasterized once, aligned to the first
+    raster, and reused for every raster. Returns nothing.
 
-        rst = proj_raster
-
-    # Define the table
-    zonal_stats_tbl = "zonal_stats_tbl"
-
-    # Run Zonal Statistics As Table
-    arcpy.ia.ZonalStatisticsAsTable(
-        in_zone_data=fc,
-        zone_field=zone_field,
-        in_value_raster=rst,
-        out_table=zonal_stats_tbl,
-        ignore_nodata="DATA",
-        statistics_type=stat_type,
-        process_as_multidimensional="CURRENT_SLICE",
-        percentile_values=[90],
-        percentile_interpolation_type="AUTO_DETECT",
-        circular_calculation="ARITHMETIC",
-        circular_wrap_value=360
+    :param fc: str, the file path of the feature class to add the zonal stats fields to.
+    :param rasters: list, the file paths of the aligned rasters that will provide the stats.
+    :param zone_field: str, the field name of the feature class unique identifier.
+    :param stat_types: list, the zonal statistic to calculate for each raster.
+    :param field_names: list, the desired name of the zonal stats field for each raster.
+    :param field_types: list, the field type of the zonal stats field for each raster.
+    """
+    # Add all the fields at once, then only populate them with the zonal stats
+    arcpy.management.AddFields(
+        in_table=fc,
+        field_description=field_descriptions(field_names, field_types)
     )
 
-    # Keep field names as-is when joining zonal stats field to shapefile
-    arcpy.env.qualifiedFieldNames = False
-    # Join the desired zonal stats field to the shapefile
-    arcpy.management.JoinField(
-        in_data=fc,
-        in_field=zone_field,
-        join_table=zonal_stats_tbl,
-        join_field=zone_field,
-        fields=stat_type,
-        fm_option="NOT_USE_FM",
-        field_mapping=None,
-        index_join_fields="NO_INDEXES"
-    )
+    # The zones are only rasterized once for all the rasters
+    zones_rst = zones_to_raster(fc, zone_field, rasters[0])
+
+    for rst, stat_type, field_name, field_type in zip(rasters, stat_types, field_names, field_types):
+        zonal_stats_rename_field(fc, rst, zone_field, stat_type, field_name, field_type, False, zones_rst)
+
+    # Clean up memory
+    arcpy.management.Delete(zones_rst)
+
+
+def zonal_stats_numpy(zones_rst, rst, stat_type):
+    """
+    Calculates a simple zonal statistic (MEAN, SUM, MINIMUM, or MAXIMUM) by reading the zone raster and the
+    overlapping cells of the value raster into NumPy arrays and grouping the cells by zone. The zone raster must be
+    aligned with the value raster (rasters_aligned()). NoData cells in the value raster are ignored, the same as
+    Zonal Statistics as Table with DATA.
+
+    :param zones_rst: str, the path of the zone raster from zones_to_raster().
+    :param rst: str, the file path of the value raster.
+    :param stat_type: str, the zonal statistic to calculate.
+    :return: dict, the zone value and the statistic for each zone with at least one cell.
+    """
+    zones = arcpy.Raster(zones_rst)
+    values = arcpy.Raster(rst)
+
+    # Read the zone raster and the cells of the value raster under it
+    lower_left = arcpy.Point(zones.extent.XMin, zones.extent.YMin)
+    zones_arr = arcpy.RasterToNumPyArray(zones)
+    values_arr = arcpy.RasterToNumPyArray(values, lower_left, zones.width, zones.height)
+
+    # Only keep cells that are in a zone and have a value
+    valid = np.ones(zones_arr.shape, dtype=bool)
+    if zones.noDataValue is not None:
+        valid &= zones_arr != zones.noDataValue
+    if values.noDataValue is not None:
+        valid &= values_arr != values.noDataValue
+
+    # Group the cells by zone
+    zone_ids, inverse = np.unique(zones_arr[valid], return_inverse=True)
+    cell_values = values_arr[valid].astype(np.float64)
+
+    if stat_type in ("MEAN", "SUM"):
+        stats = np.bincount(inverse, weights=cell_values, minlength=zone_ids.size)
+        if stat_type == "MEAN":
+            stats /= np.bincount(inverse, minlength=zone_ids.size)
+    elif stat_type == "MINIMUM":
+        stats = np.full(zone_ids.size, np.inf)
+        np.minimum.at(stats, inverse, cell_values)
+    else:
+        stats = np.full(zone_ids.size, -np.inf)
+        np.maximum.at(stats, inverse, cell_values)
+
+    return dict(zip(zone_ids.tolist(), stats.tolist()))
+
+
+def rasters_aligned(zones_rst, rst):
+    """
+    Checks whether the cells of a zone raster line up with the cells of a value raster, so zonal_stats_numpy() reads
+    the value of the same cell for each zone cell. The rasters need the same cell width and height, and the offset
+    between their lower left corners must be a whole number of cells. A value raster without a NoData value must also
+    cover the whole zone raster, since the cells read outside of it would not have a defined value.
+
+    :param zones_rst: str, the path of the zone raster from zones_to_raster().
+    :param rst: str, the file path of the value raster.
+    :return: Boolean, True if the rasters are aligned, False otherwise.
+    """
+    zones = arcpy.Raster(zones_rst)
+    values = arcpy.Raster(rst)
+
+    # Same cell size
+    cell_width = zones.meanCellWidth
+    cell_height = zones.meanCellHeight
+    if (abs(values.meanCellWidth - cell_width) > cell_width * CELL_ALIGN_TOLERANCE or
+            abs(values.meanCellHeight - cell_height) > cell_height * CELL_ALIGN_TOLERANCE):
+        return False
 
-    rename_field(fc, stat_type, field_name, field_type)
+    # Cell edges on the same grid
+    for offset in ((zones.extent.XMin - values.extent.XMin) / cell_width,
+                   (zones.extent.YMin - values.extent.YMin) / cell_height):
+        if abs(offset - round(offset)) > CELL_ALIGN_TOLERANCE:
+            return False
 
-    # Clean up GDB
-    arcpy.management.Delete(zonal_stats_tbl)
+    # Cells outside the value raster only read as NoData if the value raster has a NoData value
+    if values.noDataValue is None:
+        return (values.extent.XMin <= zones.extent.XMin and values.extent.YMin <= zones.extent.YMin and
+                values.extent.XMax >= zones.extent.XMax and values.extent.YMax >= zones.extent.YMax)
 
-    if ('proj_raster' in locals()) or ('proj_raster' in globals()):
-        arcpy.management.Delete(proj_raster)
+    return True
 
 
 def del_existing_fields(fc):
@@ -202,8 +441,8 @@ def del_existing_fields(fc):
 
     :param fc: str, the file path of the feature class to add zonal stats field to.
     """
-    # Get a list of fields
-    fields = [f.name for f in arcpy.ListFields(fc)]
+    # Get a set of fields
+    fields = {f.name for f in arcpy.ListFields(fc)}
 
     # Attribute fields to check
     attr_fields = [
@@ -232,14 +471,11 @@ def del_existing_fields(fc):
     # Compare feature class fields with attribute fields and make a list of only the ones that match
     fields_to_del = [f for f in attr_fields if f in fields]
 
-    # Check if there are fields to delete
-    if len(fields_to_del) > 0:
-        # Join fields into a string to use in DeleteField if there is more than one field
-        fields_string = ";".join(fields_to_del)
-
+    # Check if there are fields to delete, all the fields are deleted at once
+    if fields_to_del:
         arcpy.management.DeleteField(
             in_table=fc,
-            drop_field=fields_string,
+            drop_field=fields_to_del,
             method="DELETE_FIELDS"
         )
 
@@ -247,7 +483,7 @@ def del_existing_fields(fc):
 def del_select_patches(all_patches, patches_fc):
     """
     Used to delete selected patches when running Add Attributes to Select Patches & Export CSV geoprocessing tool. If
-    no patches are selected, the select patches feature class is used to select identical patches. Returns nothing.
+    no patches are selected, the patches with the same PatchName as the select patches are deleted. Returns nothing.
 
     :param all_patches: str, feature class or feature layer containing all patches along with the selected patches.
     :param patches_fc: str, feature class containing only the selected patches.
@@ -263,58 +499,344 @@ def del_select_patches(all_patches, patches_fc):
         patches_lyr = "patches_layer"
         arcpy.management.MakeFeatureLayer(all_patches, patches_lyr)
 
-    # Find out how many patches are selected
-    select_count = arcpy.management.GetCount(patches_lyr)
+    # If no patches are selected, delete the patches with the same PatchName as the select patches, otherwise all
+    # features will be deleted
+    if not arcpy.Describe(patches_lyr).FIDSet:
+        # Read the PatchName of the select patches
+        with arcpy.da.SearchCursor(patches_fc, ["PatchName"]) as cursor:
+            patch_names = frozenset(row[0] for row in cursor)
 
-    # Select the patches if none are selected, otherwise all features will be deleted
-    if int(select_count[0]) == 0:
-        # Create a layer for select patches
-        select_lyr = "select_layer"
-        arcpy.management.MakeFeatureLayer(patches_fc, select_lyr)
+        # Delete the matching patches in one pass
+        with arcpy.da.UpdateCursor(patches_lyr, ["PatchName"]) as cursor:
+            for row in cursor:
+                if row[0] in patch_names:
+                    cursor.deleteRow()
+    else:
+        arcpy.management.DeleteFeatures(patches_lyr)
 
-        # Select patches that are identical to the select patches
-        arcpy.management.SelectLayerByLocation(
-            in_layer=patches_lyr,
-            overlap_type=f"ARE_IDENTICAL_TO",
-            select_features=select_lyr,
-            search_distance=None,
-            selection_type="NEW_SELECTION",
-            invert_spatial_relationship="NOT_INVERT"
-        )
 
-    arcpy.management.DeleteFeatures(patches_lyr)
+def append_patches(in_fc, target_fc):
+    """
+    Appends the patches from the input feature class to the target feature class (or feature layer) with an insert
+    cursor inside a single edit operation on the workspace from get_workspace(). Only fields that exist in both and can
+    be edited are copied. Returns nothing.
+
+    :param in_fc: str, the file path of the feature class containing the patches to append.
+    :param target_fc: str, the feature class or feature layer to append the patches to.
+    """
+    # Get the fields that can be edited in the target, OID and Shape_Area/Shape_Length are maintained by the GDB
+    target_fields = {f.name for f in arcpy.ListFields(target_fc) if f.editable and f.type not in ("OID", "Geometry")}
+    # Keep fields in both feature classes and add the geometry
+    fields = [f.name for f in arcpy.ListFields(in_fc) if f.name in target_fields] + ["SHAPE@"]
+
+    # Start an edit session and operation on the target workspace, edits are saved when the with block ends
+    workspace = get_workspace(target_fc)
+    with arcpy.da.Editor(workspace), arcpy.da.SearchCursor(in_fc, fields) as s_cursor, \
+            arcpy.da.InsertCursor(target_fc, fields) as i_cursor:
+        for row in s_cursor:
+            i_cursor.insertRow(row)
+
+
+def get_workspace(fc):
+    """
+    Gets the workspace of a feature class or feature layer from its catalog path, walking up through a feature dataset
+    to the geodatabase if the feature class is in one.
+
+    :param fc: str, the file path of the feature class (or feature layer).
+    :return: str, the file path of the geodatabase, or the folder if the feature class is not in a geodatabase.
+    """
+    catalog_path = arcpy.Describe(fc).catalogPath
+
+    # Walk up the catalog path until the geodatabase
+    workspace = catalog_path
+    while os.path.splitext(workspace)[1].lower() not in (".gdb", ".sde"):
+        parent = os.path.dirname(workspace)
+        # Not in a geodatabase (e.g., a shapefile), so the folder is the workspace
+        if parent == workspace:
+            return os.path.dirname(catalog_path)
+        workspace = parent
+
+    return workspace
 
 
 def update_area_perim(patches_fc):
     """
     Updates the area and perim fields with Shape_Area and Shape_Length values since those fields are not updated when a
-    patch is clipped, split, or merged. Returns nothing.
+    patch is clipped, split, or merged. Only patches whose area or perim changed are written. Returns nothing.
 
     :param patches_fc: str, the file path of the feature class that needs area and perim fields updated.
     """
-    # Function to use in calculate field, only change area or perim if they are different from Shape_Area or
-    # Shape_Length, and round area and perim to a whole number.
-    code = """def update(orig, new):
-                        if orig == new:
-                            return orig
-                        else:
-                            return round(new) """
-
-    # Update the area and perim fields, if applicable
-    arcpy.management.CalculateField(
-        in_table=patches_fc,
-        field="area",
-        expression="update(!area!, !Shape_Area!)",
-        expression_type="PYTHON3",
-        code_block=code,
-        field_type="LONG"
-    )
+    with arcpy.da.UpdateCursor(patches_fc, ["area", "perim", "SHAPE@AREA", "SHAPE@LENGTH"]) as cursor:
+        for row in cursor:
+            # Only change area or perim if they are different from Shape_Area or Shape_Length, and round area and
+            # perim to a whole number
+            area = row[0] if row[0] == row[2] else round(row[2])
+            perim = row[1] if row[1] == row[3] else round(row[3])
+
+            # Skip writing patches that did not change
+            if area != row[0] or perim != row[1]:
+                cursor.updateRow([area, perim, row[2], row[3]])
+
+
+def add_spatial_index(fc):
+    """
+    Adds a spatial index to the feature class if it does not already have one, so spatial selections against it do not
+    have to test every feature. Existing spatial indexes are not rebuilt. Returns nothing.
+
+    :param fc: str, the file path of the feature class to add the spatial index to.
+    """
+    if not arcpy.Describe(fc).hasSpatialIndex:
+        arcpy.management.AddSpatialIndex(fc)
+
+
+def id_where_clause(field, ids):
+    """
+    Creates a where clause that selects the IDs. Runs of three or more consecutive IDs are written as BETWEEN ranges
+    and the remaining IDs are written as one IN list, so the clause stays short when there are many IDs.
+
+    :param field: str, the name of the ID field.
+    :param ids: list, the IDs (integers) to select.
+    :return: str, the where clause, in parentheses so it can be negated or combined with other clauses.
+    """
+    ids = sorted(set(ids))
+
+    clauses = []
+    singles = []
+
+    # Walk the sorted IDs and close each run when the next ID is not consecutive
+    start = ids[0]
+    for prev, current in zip(ids, ids[1:] + [None]):
+        if current == prev + 1:
+            continue
 
-    arcpy.management.CalculateField(
-        in_table=patches_fc,
-        field="perim",
-        expression="update(!perim!, !Shape_Length!)",
-        expression_type="PYTHON3",
-        code_block=code,
-        field_type="LONG"
+        if prev - start >= 2:
+            clauses.append(f"{field} BETWEEN {start} AND {prev}")
+        else:
+            singles.extend(range(start, prev + 1))
+
+        start = current
+
+    if singles:
+        clauses.append(f"{field} IN ({', '.join(map(str, singles))})")
+
+    return f"({' OR '.join(clauses)})"
+
+
+def get_max_value(fc, field):
+    """
+    Gets the maximum value of a field by sorting the rows in descending order and reading only the first row.
+
+    :param fc: str, the file path of the feature class or table.
+    :param field: str, the name of the field to get the maximum value of.
+    :return: the maximum value of the field.
+    """
+    with arcpy.da.SearchCursor(fc, [field], sql_clause=(None, f"ORDER BY {field} DESC")) as cursor:
+        max_value = next(cursor)[0]
+
+    return max_value
+
+
+def get_min_max_values(fc, field):
+    """
+    Gets the minimum and maximum values of a field using Summary Statistics, so both values are calculated in a single
+    pass by the geoprocessing tool.
+
+    :param fc: str, the file path of the feature class or table.
+    :param field: str, the name of the field to get the minimum and maximum values of.
+    :return: tuple, the minimum and maximum values of the field.
+    """
+    # Create table name in memory since it is only needed to read the values
+    stats_tbl = "memory\\min_max_tbl"
+
+    # Calculate the minimum and maximum values
+    arcpy.analysis.Statistics(
+        in_table=fc,
+        out_table=stats_tbl,
+        statistics_fields=[[field, "MIN"], [field, "MAX"]]
     )
+
+    # The statistics table only has one row
+    with arcpy.da.SearchCursor(stats_tbl, [f"MIN_{field}", f"MAX_{field}"]) as cursor:
+        min_value, max_value = next(cursor)
+
+    # Clean up memory
+    arcpy.management.Delete(stats_tbl)
+
+    return min_value, max_value
+
+
+def bulk_set(fc, field_values, where_clause=None, read_fields=None):
+    """
+    Populates several fields of a feature class with one Update Cursor pass. Each field is set to a constant value, or
+    to the value returned by a function of the row. Returns nothing.
+
+    :param fc: str, the file path of the feature class (or feature layer) with the fields to populate.
+    :param field_values: dict, the field names and the values to set them to; a function is called with a dictionary of
+    the row values (read_fields and the fields to populate) to get the value for each row.
+    :param where_clause: str (optional), the where clause for the rows to populate; all rows (or the selected rows of a
+    feature layer) if None.
+    :param read_fields: list (optional), the names of other fields the functions need to read.
+    """
+    fields = list(field_values)
+    cursor_fields = (read_fields or []) + fields
+
+    with arcpy.da.UpdateCursor(fc, cursor_fields, where_clause) as cursor:
+        for row in cursor:
+            row_values = dict(zip(cursor_fields, row))
+            cursor.updateRow(row[:len(cursor_fields) - len(fields)] +
+                             [value(row_values) if callable(value) else value for value in field_values.values()])
+
+
+@functools.cache
+def read_polygons(fc, fields):
+    """
+    Reads the polygons and attribute values of a feature class into a list and indexes them with polygon_grid(), so
+    the point-in-polygon tests that are repeated for every year of patches read each feature class only once. Call
+    read_polygons.cache_clear() at the start and end of a tool, so any edits made to the feature classes between tool
+    runs are picked up and the polygons are not kept in memory after the tool.
+
+    :param fc: str, the file path of the polygon feature class.
+    :param fields: tuple, the names of the fields to read.
+    :return: tuple, the spatial reference of the feature class, a list of (polygon, extent, values) for each polygon,
+    and the grid index of the polygons.
+    """
+    with arcpy.da.SearchCursor(fc, ["SHAPE@"] + list(fields)) as cursor:
+        polygons = [(row[0], row[0].extent, row[1:]) for row in cursor if row[0]]
+
+    return arcpy.Describe(fc).spatialReference, polygons, polygon_grid([extent for _, extent, _ in polygons])
+
+
+def polygon_grid(extents):
+    """
+    Builds a grid index of polygon extents, so only the polygons in the grid cells of a geometry are tested against
+    it. The cell size is the average polygon extent size, but no smaller than needed to keep the grid to
+    GRID_MAX_CELLS cells along each side.
+
+    :param extents: list, the arcpy.Extent of each polygon.
+    :return: tuple, the grid origin X and Y, cell size, number of columns and rows, and a dictionary of the
+    (column, row) of each cell and the list of indexes of the polygons whose extent overlaps it; None if there are no
+    polygons.
+    """
+    if not extents:
+        return None
+
+    # Get the extent of all the polygons
+    x_min = min(e.XMin for e in extents)
+    y_min = min(e.YMin for e in extents)
+    width = max(e.XMax for e in extents) - x_min
+    height = max(e.YMax for e in extents) - y_min
+
+    # Get the cell size, the polygons could all be the same point
+    avg_size = sum(max(e.width, e.height) for e in extents) / len(extents)
+    cell_size = max(avg_size, width / GRID_MAX_CELLS, height / GRID_MAX_CELLS) or 1.0
+    n_cols = int(width // cell_size) + 1
+    n_rows = int(height // cell_size) + 1
+
+    # Add each polygon to the cells its extent overlaps, the indexes in each cell stay in the order of the polygons
+    cells = {}
+    for i, e in enumerate(extents):
+        for col in range(int((e.XMin - x_min) // cell_size), int((e.XMax - x_min) // cell_size) + 1):
+            for row in range(int((e.YMin - y_min) // cell_size), int((e.YMax - y_min) // cell_size) + 1):
+                cells.setdefault((col, row), []).append(i)
+
+    return x_min, y_min, cell_size, n_cols, n_rows, cells
+
+
+def grid_candidates(grid, extent, relationship):
+    """
+    Finds the polygons in a polygon_grid() grid that could be completely within (COMPLETELY_WITHIN) or intersect
+    (INTERSECT) a geometry's extent.
+
+    :param grid: tuple, the grid index from polygon_grid().
+    :param extent: arcpy.Extent, the extent of the geometry.
+    :param relationship: str, the spatial relationship, COMPLETELY_WITHIN or INTERSECT.
+    :return: list, the indexes of the candidate polygons in the order of the polygons.
+    """
+    x_min, y_min, cell_size, n_cols, n_rows, cells = grid
+
+    # Get the cell of the lower left corner of the extent
+    col_min = int((extent.XMin - x_min) // cell_size)
+    row_min = int((extent.YMin - y_min) // cell_size)
+
+    # A polygon that contains the geometry has an extent that overlaps every cell of the geometry, so one cell is
+    # enough
+    if relationship == "COMPLETELY_WITHIN":
+        return cells.get((col_min, row_min), [])
+
+    # Get the polygons in all the cells of the geometry, only the cells inside the grid
+    col_max = min(int((extent.XMax - x_min) // cell_size), n_cols - 1)
+    row_max = min(int((extent.YMax - y_min) // cell_size), n_rows - 1)
+    candidates = set()
+    for col in range(max(col_min, 0), col_max + 1):
+        for row in range(max(row_min, 0), row_max + 1):
+            candidates.update(cells.get((col, row), ()))
+
+    return sorted(candidates)
+
+
+def polygon_values(pts, key_field, polygons_fc, join_fields, relationship):
+    """
+    Finds the attribute values of the first polygon that each point is within (COMPLETELY_WITHIN) or intersects
+    (INTERSECT). The polygons are read by read_polygons() and tested with match_polygon().
+
+    :param pts: str, the file path of the point feature class.
+    :param key_field: str, the field in pts used as the key for the values (e.g., the zone field).
+    :param polygons_fc: str, the file path of the polygon feature class with the attributes to join.
+    :param join_fields: list, the names of the fields in polygons_fc to get the values of, can be empty if only the
+    matching points are needed.
+    :param relationship: str, the spatial relationship, COMPLETELY_WITHIN or INTERSECT.
+    :return: dict, the key_field value of each point with a matching polygon and a tuple of the polygon values.
+    """
+    sr, polygons, grid = read_polygons(polygons_fc, tuple(join_fields))
+
+    # Find the values for each point, reading the points in the spatial reference of the polygons
+    pts_values = {}
+    with arcpy.da.SearchCursor(pts, [key_field, "SHAPE@"], spatial_reference=sr) as cursor:
+        for key, pt in cursor:
+            if not pt:
+                continue
+
+            attrs = match_polygon(pt, polygons, grid, relationship)
+            if attrs is not None:
+                pts_values[key] = attrs
+
+    return pts_values
+
+
+def match_polygon(shape, polygons, grid, relationship):
+    """
+    Finds the first polygon that the geometry is completely within (COMPLETELY_WITHIN) or intersects (INTERSECT). Only
+    the polygons in the grid cells of the geometry whose extent could match the extent of the geometry are tested with
+    the geometry relationship.
+
+    :param shape: arcpy.Geometry, the geometry to test, in the same spatial reference as the polygons.
+    :param polygons: list, the (polygon, extent, values) for each polygon from read_polygons().
+    :param grid: tuple, the grid index of the polygons from read_polygons(); None if there are no polygons.
+    :param relationship: str, the spatial relationship, COMPLETELY_WITHIN or INTERSECT.
+    :return: tuple, the values of the first matching polygon, None if there is no matching polygon.
+    """
+    if grid is None:
+        return None
+
+    shape_ext = shape.extent
+
+    for i in grid_candidates(grid, shape_ext, relationship):
+        polygon, extent, attrs = polygons[i]
+        if relationship == "COMPLETELY_WITHIN":
+            # Skip polygons whose extent does not contain the extent of the geometry
+            if (shape_ext.XMin < extent.XMin or shape_ext.XMax > extent.XMax or
+                    shape_ext.YMin < extent.YMin or shape_ext.YMax > extent.YMax):
+                continue
+
+            if polygon.contains(shape):
+                return attrs
+        else:
+            # Skip polygons whose extent does not overlap the extent of the geometry
+            if (shape_ext.XMin > extent.XMax or shape_ext.XMax < extent.XMin or
+                    shape_ext.YMin > extent.YMax or shape_ext.YMax < extent.YMin):
+                continue
+
+            if not polygon.disjoint(shape):
+                return attrs
+
+    return None
@@ -3,7 +3,8 @@ Functions to support exporting patches as CSV or for GEE.
 * primary_validation()
 * extract_data()
 * clean_data()
-* check_mismatch()
+* get_engine()
+* load_change_types()
 * check_change_types()
 * check_confidence()
 * check_duplicate_patch_names()
@@ -11,14 +12,182 @@ Functions to support exporting patches as CSV or for GEE.
 * exp_shp_spec_fields()
 * export_patches_csv()
 * export_patches_shp()
+* add_messages()
 """
+import atexit
+import functools
 import os.path
 import arcpy
+import numpy as np
 import pandas as pd
 from sqlalchemy import create_engine
 import csv
 
 
+# Buffer size for writing CSVs
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# Spatial references for converting lat/long
+NAD83_SR = arcpy.SpatialReference(4269)
+WGS84_SR = arcpy.SpatialReference(4326)
+# Geographic transformation between NAD83 and WGS84, the ArcGIS Pro default for the conterminous US
+NAD83_WGS84_TRANSFORMATION = "WGS_1984_(ITRF00)_To_NAD_1983"
+
+# Number of lines to display in each geoprocessing message
+MESSAGE_BLOCK_SIZE = 100
+
+# Field types read into the data frame with FeatureClassToNumPyArray
+NUMERIC_FIELD_TYPES = ("SmallInteger", "Integer", "Single", "Double", "OID")
+
+# Values that stand in for nulls in integer fields read with FeatureClassToNumPyArray
+INTEGER_NULL_VALUES = {"SmallInteger": -32768, "Integer": -2147483648}
+
+# Patches with events, the only ones exported for GEE
+GEE_WHERE_CLAUSE = "EventType IS NOT NULL And EventType NOT IN ('Mask', 'Model')"
+
+# Text fields that are typed in, the only fields that can hold line breaks
+FREE_TEXT_FIELDS = ("PatchName", "ChangeDesc", "DistName", "LabeledBy", "EventDate")
+
+# Text fields with only a few distinct values, stored as categories in the data frame
+CATEGORY_FIELDS = ("EventType", "ChangeType", "AltType", "Park", "VegCode", "CoordType", "LLDatum", "LandMgmt",
+                   "Watershed", "WildName")
+
+# List of data.Patches fields to include in CSV, if they exist
+# MapPatch and PatchNotes are not included in this list
+PATCHES_CSV_FIELDS = (
+    'Park',
+    'PatchName',
+    'yod',
+    'annualID',
+    'X_Coord_m',
+    'Y_Coord_m',
+    'Latitude',
+    'Longitude',
+    'UTMX',
+    'UTMY',
+    'CoordType',
+    'idxMagMn',
+    'durMn',
+    'durSd',
+    'area',
+    'perim',
+    'paratio',
+    'Watershed',
+    'WildName',
+    'LandMgmt',
+    'EastWest',
+    'ElevMean',
+    'SlopeMean',
+    'Aspect',
+    'Protected',
+    'InBuffer',
+    'InPark',
+    'InMask',
+    'VegCode',
+    'DistYear',
+    'DistName',
+    'OverlapPrv',
+    'Split',
+    'EventType',
+    'ChangeType',
+    'Confidence',
+    'AltType',
+    'ChangeDesc',
+    'EventDate',
+    'LabeledBy',
+    'PriorRun',
+    'PostDist',
+)
+
+# List of fields to export for GEE
+PATCHES_SHP_FIELDS = (
+    'AltType',
+    'ChangeDesc',
+    'ChangeType',
+    'Confidence',
+    'DistYear',
+    'DistName',
+    'EventType',
+    'InBuffer',
+    'InMask',
+    'InPark',
+    'MAJORAXIS',
+    'MINORAXIS',
+    'ORIENTATION',
+    'Aspect',
+    'PatchName',
+    'Protected',
+    'THICKNESS',
+    'X_Coord_m',
+    'Y_Coord_m',
+    'Latitude',
+    'Longitude',
+    'paratio',
+    'Park',
+    'annualID',
+    'area',
+    'perim',
+    'shape_1',
+    'index',
+    'uniqID',
+    'yod',
+    'durMn',
+    'durSd',
+    'idxMagMn',
+    'idxMagSd',
+    'tcbMagMn',
+    'tcbMagSd',
+    'tcbPreMn',
+    'tcbPreSd',
+    'tcbPst01Mn',
+    'tcbPst01Sd',
+    'tcbPst03Mn',
+    'tcbPst03Sd',
+    'tcbPst07Mn',
+    'tcbPst07Sd',
+    'tcbPst15Mn',
+    'tcbPst15Sd',
+    'tcbPstMn',
+    'tcbPstSd',
+    'tcgMagMn',
+    'tcgMagSd',
+    'tcgPreMn',
+    'tcgPreSd',
+    'tcgPst01Mn',
+    'tcgPst01Sd',
+    'tcgPst03Mn',
+    'tcgPst03Sd',
+    'tcgPst07Mn',
+    'tcgPst07Sd',
+    'tcgPst15Mn',
+    'tcgPst15Sd',
+    'tcgPstMn',
+    'tcgPstSd',
+    'tcwMagMn',
+    'tcwMagSd',
+    'tcwPreMn',
+    'tcwPreSd',
+    'tcwPst01Mn',
+    'tcwPst01Sd',
+    'tcwPst03Mn',
+    'tcwPst03Sd',
+    'tcwPst07Mn',
+    'tcwPst07Sd',
+    'tcwPst15Mn',
+    'tcwPst15Sd',
+    'tcwPstMn',
+    'tcwPstSd',
+    'Shape_Area',
+    'Shape_Length',
+)
+
+# Fields exported for GEE that don't need values
+SHP_NO_CHECK_FIELDS = frozenset({'AltType', 'ChangeDesc', 'DistYear', 'DistName'})
+
+# Fields exported for GEE that need values
+SHP_VALUE_FIELDS = tuple(f for f in PATCHES_SHP_FIELDS if f not in SHP_NO_CHECK_FIELDS)
+
+
 def primary_validation(patches_fc, patches_fields, csv_exp):
     """
     This is the primary validation function for export tools. This function calls other functions to extract patches
@@ -31,16 +200,14 @@ def primary_validation(patches_fc, patches_fields, csv_exp):
     :return: Boolean and DataFrame, whether the validation checks passed and data is good for export and a pandas
     data frame with the patches_fc data.
     """
-    # Extract the data
-    csv_df = extract_data(patches_fc, patches_fields)
-
-    # Clean the data if exporting to CSV
+    # Extract and clean the data if exporting to CSV
     if csv_exp:
-        csv_df = clean_data(csv_df)
-    else:  # Only want rows with Events when exporting for GEE
-        csv_df = csv_df[csv_df["EventType"].notna() &
-                        (csv_df["EventType"] != "Mask") &
-                        (csv_df["EventType"] != "Model")]
+        csv_df = clean_data(extract_data(patches_fc, patches_fields))
+    else:  # Only want rows with Events when exporting for GEE, so only those rows are read
+        csv_df = extract_data(patches_fc, patches_fields, GEE_WHERE_CLAUSE)
+
+    # Store the low cardinality text fields as categories, which makes the checks below compare integer codes
+    csv_df = csv_df.astype({f: "category" for f in CATEGORY_FIELDS if f in csv_df.columns})
 
     # Variable no_export... to keep track of issues, that way all the checks will be performed before stopping the tool
     # but before saving the CSV.
@@ -59,7 +226,7 @@ def primary_validation(patches_fc, patches_fields, csv_exp):
     return no_export, csv_df
 
 
-def extract_data(patches_fc, patches_fields):
+def extract_data(patches_fc, patches_fields, where_clause=None):
     """
     Compares the field names of the patches feature class with a list of fields, creates a list of fields that the
     feature class is missing, and reads only fields that match from the feature class attribute table into a pandas
@@ -67,10 +234,12 @@ def extract_data(patches_fc, patches_fields):
 
     :param patches_fc: str, the file path to the patches feature class.
     :param patches_fields: list,list of fields to be extracted from the feature class.
+    :param where_clause: str, optional SQL expression to only extract some of the patches.
     :return: data frame, the feature class attribute table with required fields/columns.
     """
-    # Get a list of all the feature class fields
-    fc_fields = [f.name for f in arcpy.ListFields(patches_fc)]
+    # Get the type of each of the feature class fields
+    fc_field_types = {f.name: f.type for f in arcpy.ListFields(patches_fc)}
+    fc_fields = list(fc_field_types)
 
     # Compare feature class fields with data.Patches fields and make a list of only the ones that match
     fields_to_export = [f for f in patches_fields if f in fc_fields]
@@ -81,23 +250,52 @@ def extract_data(patches_fc, patches_fields):
     if len(missing_fields) > 0:
         arcpy.AddWarning(f'The following data.Patches fields were not found in the feature class: {missing_fields}.')
 
-    # Create an empty list to hold the data
-    csv_data = []
-
-    # Use SearchCursor to extract the data from the feature class
-    with arcpy.da.SearchCursor(patches_fc, fields_to_export) as cursor:
-        for row in cursor:
-            csv_data.append(row)
-
-    # Create a dataframe from the data
-    csv_df = pd.DataFrame(csv_data, columns=fields_to_export)
+    # Split the fields into numeric fields, which can be read straight into NumPy arrays, and the other fields
+    numeric_fields = [f for f in fields_to_export if fc_field_types[f] in NUMERIC_FIELD_TYPES]
+    other_fields = [f for f in fields_to_export if fc_field_types[f] not in NUMERIC_FIELD_TYPES]
+
+    # Read the numeric fields into a NumPy array, integer fields need a value to stand in for nulls
+    null_values = {f: INTEGER_NULL_VALUES[fc_field_types[f]] for f in numeric_fields
+                   if fc_field_types[f] in INTEGER_NULL_VALUES}
+    numeric_arr = arcpy.da.FeatureClassToNumPyArray(patches_fc, ["OID@"] + numeric_fields, where_clause,
+                                                    skip_nulls=False, null_value=null_values)
+
+    # Create each numeric column from the array, integer fields with nulls are floats, the same as pandas would infer
+    csv_data = {}
+    for field in numeric_fields:
+        values = numeric_arr[field]
+        if field in null_values:
+            is_null = values == null_values[field]
+            if is_null.any():
+                values = values.astype(np.float64)
+                values[is_null] = np.nan
+            csv_data[field] = values.astype(np.int64, copy=False) if values.dtype.kind == "i" else values
+        else:
+            csv_data[field] = values.astype(np.float64, copy=False)
+    numeric_df = pd.DataFrame(csv_data, index=numeric_arr["OID@"], columns=numeric_fields)
+
+    # Use SearchCursor to extract the text and date fields from the feature class
+    with arcpy.da.SearchCursor(patches_fc, ["OID@"] + other_fields, where_clause) as cursor:
+        rows = list(cursor)
+
+    # Split the rows into one column per field
+    columns = list(zip(*rows)) if rows else [()] * (len(other_fields) + 1)
+
+    # Create each column with a type based on the field type, so the data frame does not have to infer the types from
+    # the Python objects
+    csv_data = {}
+    for field, values in zip(other_fields, columns[1:]):
+        if fc_field_types[field] == "String":
+            csv_data[field] = pd.Series(values, dtype=object)
+        else:
+            csv_data[field] = pd.Series(values)
+    other_df = pd.DataFrame(csv_data, columns=other_fields).set_axis(pd.Index(columns[0]), axis=0)
 
-    # Add the missing fields to the dataframe with null/NA values
-    for missing_field in missing_fields:
-        csv_df[missing_field] = pd.NA
+    # Create a dataframe from the columns, matching the rows on the object ID
+    csv_df = pd.concat([numeric_df, other_df], axis=1).reset_index(drop=True)
 
-    # Reorder the dataframe columns to match patches_fields list
-    csv_df = csv_df[patches_fields]
+    # Order the columns to match patches_fields list, adding the missing fields with null/NA values
+    csv_df = csv_df.reindex(columns=list(patches_fields), fill_value=pd.NA)
 
     return csv_df
 
@@ -111,33 +309,57 @@ def clean_data(csv_df):
     :param csv_df: data frame, the feature class attribute table with required fields/columns.
     :return: data frame, the cleaned feature class attribute table with required fields/columns.
     """
-    # Replace any zeros with null/NA
-    csv_df[["Confidence", "DistYear"]] = csv_df[["Confidence", "DistYear"]].replace(0, pd.NA)
-
-    # Replace single spaces with null/NA
-    csv_df[["EventType", "ChangeType", "AltType", "ChangeDesc", "DistName"]] = (
-        csv_df[["EventType", "ChangeType", "AltType", "ChangeDesc", "DistName"]].replace(" ", pd.NA))
+    # Replace any zeros and single spaces with null/NA in one pass over the columns
+    nulls = {"Confidence": {0: pd.NA}, "DistYear": {0: pd.NA}}
+    nulls.update({f: {" ": pd.NA} for f in ("EventType", "ChangeType", "AltType", "ChangeDesc", "DistName")})
+    csv_df = csv_df.replace(nulls)
 
-    # Remove anything that might mess with the SQL Server import
-    csv_df = csv_df.replace(r'[\r\n]', ' ', regex=True)
+    # Remove anything that might mess with the SQL Server import, only the typed in text fields can hold line breaks
+    for field in FREE_TEXT_FIELDS:
+        if field in csv_df.columns and csv_df[field].dtype == object:
+            csv_df[field] = csv_df[field].str.replace(r'[\r\n]', ' ', regex=True)
 
     return csv_df
 
 
-def check_mismatch(df_row, valid_values, column_to_check, column_to_return):
+@functools.lru_cache(maxsize=4)
+def get_engine(server, db):
     """
-    Checks mismatch between data frame column value and a list of values. If there is a mismatch, the values from
-    the columns are returned, otherwise, None is returned.
-
-    :param df_row: series, row of a pandas data frame.
-    :param valid_values: list, valid values to check row value against.
-    :param column_to_check: str, name of column containing values to check values against valid values.
-    :param column_to_return: str, name of the column to return the value of along with the checked value.
-    :return: checked value and return column value if the checked value is not valid, other returns None and None.
+    Creates the database engine, which is kept for each server and database so its connection pool is reused. The
+    engine is disposed of when Python exits.
+
+    :param server: str, the name of the database server.
+    :param db: str, the name of the database.
+    :return: engine, the SQLAlchemy engine for the database.
     """
-    if df_row[column_to_check] not in valid_values:
-        return df_row[column_to_check], df_row[column_to_return]
-    return None, None
+    # Create the connection string
+    connection_string = f'mssql+pyodbc://{server}/{db}?driver=ODBC+Driver+17+for+SQL+Server&Trusted_Connection=yes'
+    # Pass connection string and connect to the db, checking pooled connections are still alive before using them
+    engine = create_engine(connection_string, pool_pre_ping=True, pool_recycle=1800)
+    # Close the database connections when Python exits
+    atexit.register(engine.dispose)
+
+    return engine
+
+
+@functools.lru_cache(maxsize=4)
+def load_change_types(server, db):
+    """
+    Reads the change types from the database lookup table. The result is cached for each server and database, so a
+    tool that validates several feature classes only queries the lookup table once. Call load_change_types.cache_clear()
+    at the start of a tool, so any edits made to the lookup table between tool runs are picked up.
+
+    :param server: str, the name of the database server.
+    :param db: str, the name of the database.
+    :return: frozenset, the change types in lookup.ChangeType, including the empty space used for blank values.
+    """
+    # Get the change types from the lookup table
+    qry = 'SELECT ChangeType FROM lookup.ChangeType'
+    # Read ChangeType into a pandas dataframe, the connection goes back to the engine's pool afterwards
+    change_types = pd.read_sql(qry, get_engine(server, db))
+
+    # Since there is an empty space for blank values, add that to the set
+    return frozenset(change_types['ChangeType']) | {" "}
 
 
 def check_change_types(csv_df):
@@ -153,51 +375,31 @@ def check_change_types(csv_df):
     if csv_df['ChangeType'].isna().all():
         return False
 
-    # Check to see if all the change types match the change types in the database lookup table
-    # Save server and database names as variables
-    server = 'inpolymnrm4'
-    db = 'LPa01_Landscape_Change'
-    # Create the connection string
-    connection_string = f'mssql+pyodbc://{server}/{db}?driver=ODBC+Driver+17+for+SQL+Server&Trusted_Connection=yes'
-    # Pass connection string and connect to the db
-    engine = create_engine(connection_string)
+    # Get the change types from the database lookup table
+    change_types = load_change_types('inpolymnrm4', 'LPa01_Landscape_Change')
 
-    # Get the change types from the lookup table
-    qry = 'SELECT ChangeType FROM lookup.ChangeType'
-    # Read ChangeType into a pandas dataframe
-    change_types = pd.read_sql(qry, engine)
-    # Close the database connection
-    engine.dispose()
-    # Convert the dataframe to a list
-    change_list = change_types['ChangeType'].tolist()
-    # Since there is an empty space for blank values, add that to the list
-    change_list.append(" ")
-
-    # Check for mismatches
-    changetype = csv_df.apply(lambda df_row: check_mismatch(df_row,
-                                                            change_list,
-                                                            'ChangeType',
-                                                            'PatchName'),
-                              axis=1)
-    alttype = csv_df.apply(lambda df_row: check_mismatch(df_row,
-                                                         change_list,
-                                                         'AltType',
-                                                         'PatchName'),
-                           axis=1)
-
-    # Filter out the mismatches
-    mismatch_ct = [(ct[0], ct[1]) for ct in changetype if ct[0] is not None]
-    mismatch_at = [(at[0], at[1]) for at in alttype if at[0] is not None]
-    # Get a complete list of all mismatches
-    mismatches = mismatch_ct + mismatch_at
+    # Get the distinct change types in both columns, there are usually only a few
+    observed = frozenset(csv_df['ChangeType'].dropna().unique()) | frozenset(csv_df['AltType'].dropna().unique())
+
+    # Only need to find the mismatched patches if a distinct change type is not in the lookup table
+    mismatches = []
+    if not observed <= change_types:
+        # Use the change types as categories, values that are not change types get a code of -1
+        categories = sorted(c for c in change_types if pd.notna(c))
+
+        # Check for mismatches in both columns and get a complete list of all mismatches
+        for field in ('ChangeType', 'AltType'):
+            codes = pd.Categorical(csv_df[field], categories=categories).codes
+            # Values that are null also get a code of -1, but they are not mismatches
+            bad = np.flatnonzero((codes == -1) & csv_df[field].notna().to_numpy())
+            mismatches += list(zip(csv_df[field].iloc[bad], csv_df['PatchName'].iloc[bad]))
 
     # If there are mismatches, throw an error, and display the mismatches
     if len(mismatches) > 0:
         # Change the variable because we don't want to save the CSV
         no_export = True
         arcpy.AddError("Change types in feature class do not match change types in lookup.ChangeType.")
-        for mismatch in mismatches:
-            arcpy.AddMessage(f"PatchName: {mismatch[1]}, change type: {mismatch[0]}")
+        add_messages([f"PatchName: {patch}, change type: {change_type}" for change_type, patch in mismatches])
     else:
         no_export = False
         arcpy.AddMessage("No change type mismatches found.")
@@ -216,39 +418,37 @@ def check_confidence(csv_df, only_values):
     AltType is Confidence value is 1 or 2.
     :return: Boolean, True if a confidence value is invalid, otherwise, False.
     """
-    # Get all patches that have an event
-    events = csv_df[(csv_df['EventType'] != " ") & (csv_df['EventType'].notna())]
+    # Get a mask of all patches that have an event, the checks below combine masks instead of filtering the data frame
+    has_event = csv_df['EventType'].notna() & (csv_df['EventType'] != " ")
 
-    if len(events) == 0:
+    if not has_event.any():
         return False
 
     # Find events that don't meet confidence validation rule
-    con_ck = events[(events['Confidence'] < 1) | (events['Confidence'] > 3)][['PatchName', 'Confidence']]
+    confidence = csv_df['Confidence']
+    con_ck = has_event & ((confidence < 1) | (confidence > 3))
 
     # If there are validation rule violations, throw an error, and display the violations
-    if len(con_ck) > 0:
+    if con_ck.any():
         # Change the variable because we don't want to save the CSV
         no_export = True
         arcpy.AddError("Confidence value does not pass validation rule of Confidence >= 1 and <=3.")
-        arcpy.AddMessage(f"There are {len(con_ck)} patches with invalid confidence values.")
+        arcpy.AddMessage(f"There are {con_ck.sum()} patches with invalid confidence values.")
     else:
         no_export = False
         arcpy.AddMessage("Confidence values for Events pass the data table validation rule.")
 
     if not only_values:
         # Get all patches with Confidence of 1 or 2 that do not have an EventType of Mask
-        conf_1_2 = events[(events['Confidence'] < 3) & (events['EventType'] != "Mask")]
+        conf_1_2 = has_event & (confidence < 3) & (csv_df['EventType'] != "Mask")
 
-        # AltType is present if Confidence is 1 or 2
-        conf_alttype = conf_1_2[conf_1_2['AltType'].isna()]
-        # Get only the Patch_names
-        conf_alttype_patches = conf_alttype['PatchName'].tolist()
+        # AltType is present if Confidence is 1 or 2, get only the Patch_names
+        conf_alttype_patches = csv_df.loc[conf_1_2 & csv_df['AltType'].isna(), 'PatchName'].tolist()
         # If there are validation rule violations, display the violations
         if len(conf_alttype_patches) > 0:
             no_export = no_export or True
             arcpy.AddError("There are Events with a Confidence of 1 or 2 with no AltType:")
-            for patch in conf_alttype_patches:
-                arcpy.AddMessage(f"PatchName: {patch}")
+            add_messages([f"PatchName: {patch}" for patch in conf_alttype_patches])
         else:
             no_export = no_export or False
             arcpy.AddMessage("Confidence values for Events with AltTypes passed validation.")
@@ -263,18 +463,19 @@ def check_duplicate_patch_names(csv_df):
     :param csv_df: data frame, the feature class attribute table with required fields/columns.
     :return: Boolean, True if there is a duplicate PatchName, otherwise, False.
     """
+    # Count each patch name, nulls are counted too
+    name_counts = csv_df['PatchName'].value_counts(dropna=False)
     # Find duplicate patch names
-    duplicates = csv_df[csv_df.duplicated(subset=['PatchName'], keep=False)]
-    # Get a list of patch names associated with the duplicates
-    duplicate_patches = duplicates['PatchName'].tolist()
+    duplicates = name_counts[name_counts > 1]
 
     # If there are duplicate patches, throw an error, and display the duplicate patch names
-    if len(duplicate_patches) > 0:
+    if len(duplicates) > 0:
+        # Get a list of patch names associated with the duplicates, only needed if there are any
+        duplicate_patches = csv_df.loc[csv_df['PatchName'].isin(duplicates.index), 'PatchName'].tolist()
         # Change the variable because we don't want to save the CSV
         no_export = True
         arcpy.AddError("There are duplicate patch names in the dataset.")
-        for patch in duplicate_patches:
-            arcpy.AddMessage(f"PatchName: {patch}")
+        add_messages([f"PatchName: {patch}" for patch in duplicate_patches])
     else:
         no_export = False
         arcpy.AddMessage("There are no duplicate patch names in the dataset.")
@@ -290,20 +491,23 @@ def check_fields_have_values(csv_df, value_fields):
     :param value_fields: list, the fields to check for values.
     :return: Boolean, True if all input fields have values, otherwise, False.
     """
-    # List to hold fields with missing values
-    missing_values = []
+    # Get only the fields to check
+    value_df = csv_df[list(value_fields)]
 
-    # Loop through each field to check for missing values
-    for field in value_fields:
-        if csv_df[field].isna().any() or (csv_df[field] == " ").any():
-            missing_values.append(field)
+    # Flag nulls in all the fields and single spaces in the text fields, numeric fields can't hold a space
+    missing = value_df.isna()
+    text_fields = value_df.select_dtypes(include=['object', 'category']).columns
+    missing[text_fields] |= value_df[text_fields] == " "
+
+    # Get the fields with any missing values
+    missing_any = missing.any(axis=0)
+    missing_values = missing_any[missing_any].index.tolist()
 
     # If there are missing values, display the fields with missing values
     if len(missing_values) > 0:
         no_export = True
         arcpy.AddError("There are fields with missing values.")
-        for value in missing_values:
-            arcpy.AddMessage(f"Field: {value}")
+        add_messages([f"Field: {value}" for value in missing_values])
     else:
         no_export = False
         arcpy.AddMessage("No fields with missing values were found.")
@@ -317,63 +521,6 @@ def add_lat_long_wgs84(patches_fc):
 
     :param patches_fc: str, the file path to the patches feature class.
     """
-    # Convert to points because it's easier to calculate geometry attributes that way
-    patches_pts = "patches_pts"
-    arcpy.management.XYTableToPoint(
-        in_table=patches_fc,
-        out_feature_class=patches_pts,
-        x_field="Longitude",
-        y_field="Latitude",
-        z_field=None,
-        coordinate_system='GEOGCS["GCS_North_American_1983",DATUM["D_North_American_1983",SPHEROID["GRS_1980",'
-                          '6378137.0,298.257222101]],PRIMEM["Greenwich",0.0],UNIT["Degree",0.0174532925199433]];-400 '
-                          '-400 1000000000;-100000 10000;-100000 10000;8.98315284119521E-09;0.001;0.001;IsHighPrecision'
-    )
-
-    # Calculate geometry attributes for lat/long in WGS84
-    arcpy.management.CalculateGeometryAttributes(
-        in_features=patches_pts,
-        geometry_property="Long_WGS84 POINT_X;Lat_WGS84 POINT_Y",
-        length_unit="",
-        area_unit="",
-        coordinate_system='GEOGCS["GCS_WGS_1984",DATUM["D_WGS_1984",SPHEROID["WGS_1984",6378137.0,298.257223563]],'
-                          'PRIMEM["Greenwich",0.0],UNIT["Degree",0.0174532925199433]]',
-        coordinate_format="SAME_AS_INPUT"
-    )
-
-    # Transpose WGS84 lat/long into existing lat/long fields
-    arcpy.management.CalculateField(
-        in_table=patches_pts,
-        field="Longitude",
-        expression="!Long_WGS84!",
-        expression_type="PYTHON3"
-    )
-
-    arcpy.management.CalculateField(
-        in_table=patches_pts,
-        field="Latitude",
-        expression="!Lat_WGS84!",
-        expression_type="PYTHON3"
-    )
-
-    # Delete lat/long fields from patches polygon fc
-    arcpy.management.DeleteField(
-        in_table=patches_fc,
-        drop_field=["Longitude", "Latitude"]
-    )
-
-    # Join lat/long from points to patches fc
-    arcpy.management.JoinField(
-        in_data=patches_fc,
-        in_field="PatchName",
-        join_table=patches_pts,
-        join_field="PatchName",
-        fields="Longitude;Latitude",
-        fm_option="NOT_USE_FM",
-        field_mapping=None,
-        index_join_fields="NO_INDEXES"
-    )
-
     # Add lat/long datum field
     arcpy.management.AddField(
         in_table=patches_fc,
@@ -383,16 +530,15 @@ def add_lat_long_wgs84(patches_fc):
         field_is_nullable="NULLABLE"
     )
 
-    # Populate datum field
-    arcpy.management.CalculateField(
-        in_table=patches_fc,
-        field="LLDatum",
-        expression="'WGS84'",
-        expression_type="PYTHON3"
-    )
-
-    # Clean up GDB
-    arcpy.management.Delete(patches_pts)
+    # Project each NAD83 lat/long to WGS84 with the datum transformation, write it back, and populate the datum field
+    with arcpy.da.UpdateCursor(patches_fc, ["Longitude", "Latitude", "LLDatum"]) as cursor:
+        for longitude, latitude, _ in cursor:
+            # Lat/long that are null stay null
+            if longitude is not None and latitude is not None:
+                point = arcpy.PointGeometry(arcpy.Point(longitude, latitude), NAD83_SR).projectAs(
+                    WGS84_SR, NAD83_WGS84_TRANSFORMATION)
+                longitude, latitude = point.firstPoint.X, point.firstPoint.Y
+            cursor.updateRow([longitude, latitude, "WGS84"])
 
 
 def exp_shp_spec_fields(patches_fc, exp_fields, out_folder):
@@ -413,7 +559,7 @@ def exp_shp_spec_fields(patches_fc, exp_fields, out_folder):
     arcpy.management.MakeFeatureLayer(
         patches_fc,
         temp_lyr,
-        where_clause="EventType IS NOT NULL And EventType NOT IN ('Mask', 'Model')",
+        where_clause=GEE_WHERE_CLAUSE,
         field_info=";".join([f"{field} {field} VISIBLE NONE" for field in exp_fields])
     )
 
@@ -424,10 +570,13 @@ def exp_shp_spec_fields(patches_fc, exp_fields, out_folder):
     # Create folder name for the shapefile
     shp_folder = os.path.join(out_folder, temp_fc)
 
-    # Check if folder already exists, if it does, add a suffix to it until it doesn't
+    # Check if folder already exists, if it does, add a numbered suffix to it until it doesn't
+    base_fc = temp_fc
+    suffix = 1
     while os.path.exists(shp_folder):
-        temp_fc = f"{temp_fc}_1"
+        temp_fc = f"{base_fc}_{suffix}"
         shp_folder = os.path.join(out_folder, temp_fc)
+        suffix += 1
 
     # Create the folder
     os.mkdir(shp_folder)
@@ -455,60 +604,15 @@ def export_patches_csv(patches_fc, out_fp):
     :param out_fp: str, the output file path for the CSV.
     :return no_export: Boolean, True if the patches were exported, otherwise, False.
     """
-    # List of data.Patches fields to include in CSV, if they exist
-    # MapPatch and PatchNotes are not included in this list
-    patches_fields = [
-        'Park',
-        'PatchName',
-        'yod',
-        'annualID',
-        'X_Coord_m',
-        'Y_Coord_m',
-        'Latitude',
-        'Longitude',
-        'UTMX',
-        'UTMY',
-        'CoordType',
-        'idxMagMn',
-        'durMn',
-        'durSd',
-        'area',
-        'perim',
-        'paratio',
-        'Watershed',
-        'WildName',
-        'LandMgmt',
-        'EastWest',
-        'ElevMean',
-        'SlopeMean',
-        'Aspect',
-        'Protected',
-        'InBuffer',
-        'InPark',
-        'InMask',
-        'VegCode',
-        'DistYear',
-        'DistName',
-        'OverlapPrv',
-        'Split',
-        'EventType',
-        'ChangeType',
-        'Confidence',
-        'AltType',
-        'ChangeDesc',
-        'EventDate',
-        'LabeledBy',
-        'PriorRun',
-        'PostDist'
-    ]
     # Run primary validation function to clean and validate
-    no_export, csv_df = primary_validation(patches_fc, patches_fields, True)
+    no_export, csv_df = primary_validation(patches_fc, PATCHES_CSV_FIELDS, True)
 
     if no_export:
         arcpy.AddError(f"Validation error(s). {patches_fc} NOT exported to CSV.")
     else:
-        # Write dataframe to CSV
-        csv_df.to_csv(out_fp, index=False, quoting=csv.QUOTE_NONNUMERIC, quotechar='"')
+        # Write dataframe to CSV through a 1 MB buffer, so rows are written to disk in large blocks
+        with open(out_fp, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as out_file:
+            csv_df.to_csv(out_file, index=False, quoting=csv.QUOTE_NONNUMERIC, quotechar='"')
 
         arcpy.AddMessage(f"Patches saved to: {out_fp}.")
 
@@ -523,104 +627,11 @@ def export_patches_shp(patches_fc, out_folder):
     :param out_folder: str, the folder path to export the shapefile to.
     :return no_export: Boolean, True if the patches were exported, otherwise, False.
     """
-    # List of fields to export
-    exp_fields = [
-        'AltType',
-        'ChangeDesc',
-        'ChangeType',
-        'Confidence',
-        'DistYear',
-        'DistName',
-        'EventType',
-        'InBuffer',
-        'InMask',
-        'InPark',
-        'MAJORAXIS',
-        'MINORAXIS',
-        'ORIENTATION',
-        'Aspect',
-        'PatchName',
-        'Protected',
-        'THICKNESS',
-        'X_Coord_m',
-        'Y_Coord_m',
-        'Latitude',
-        'Longitude',
-        'paratio',
-        'Park',
-        'annualID',
-        'area',
-        'perim',
-        'shape_1',
-        'index',
-        'uniqID',
-        'yod',
-        'durMn',
-        'durSd',
-        'idxMagMn',
-        'idxMagSd',
-        'tcbMagMn',
-        'tcbMagSd',
-        'tcbPreMn',
-        'tcbPreSd',
-        'tcbPst01Mn',
-        'tcbPst01Sd',
-        'tcbPst03Mn',
-        'tcbPst03Sd',
-        'tcbPst07Mn',
-        'tcbPst07Sd',
-        'tcbPst15Mn',
-        'tcbPst15Sd',
-        'tcbPstMn',
-        'tcbPstSd',
-        'tcgMagMn',
-        'tcgMagSd',
-        'tcgPreMn',
-        'tcgPreSd',
-        'tcgPst01Mn',
-        'tcgPst01Sd',
-        'tcgPst03Mn',
-        'tcgPst03Sd',
-        'tcgPst07Mn',
-        'tcgPst07Sd',
-        'tcgPst15Mn',
-        'tcgPst15Sd',
-        'tcgPstMn',
-        'tcgPstSd',
-        'tcwMagMn',
-        'tcwMagSd',
-        'tcwPreMn',
-        'tcwPreSd',
-        'tcwPst01Mn',
-        'tcwPst01Sd',
-        'tcwPst03Mn',
-        'tcwPst03Sd',
-        'tcwPst07Mn',
-        'tcwPst07Sd',
-        'tcwPst15Mn',
-        'tcwPst15Sd',
-        'tcwPstMn',
-        'tcwPstSd',
-        'Shape_Area',
-        'Shape_Length'
-    ]
-
     # Run primary validation function to validate patches
-    no_export, csv_df = primary_validation(patches_fc, exp_fields, False)
-
-    # List of fields not to check
-    no_check_fields = [
-        'AltType',
-        'ChangeDesc',
-        'DistYear',
-        'DistName'
-    ]
+    no_export, csv_df = primary_validation(patches_fc, PATCHES_SHP_FIELDS, False)
 
-    # Get a list of only fields to check
-    value_fields = [field for field in exp_fields if field not in no_check_fields]
-
-    # Check that those fields have values
-    no_export_values = check_fields_have_values(csv_df, value_fields)
+    # Check that the fields that need values have values
+    no_export_values = check_fields_have_values(csv_df, SHP_VALUE_FIELDS)
 
     # Combine no_exports, only need one True to not export
     no_export = no_export or no_export_values
@@ -629,8 +640,19 @@ def export_patches_shp(patches_fc, out_folder):
         arcpy.AddError(f"Validation error(s). {patches_fc} NOT exported to CSV.")
     else:
         # Export feature class to shapefile
-        out_shp = exp_shp_spec_fields(patches_fc, exp_fields, out_folder)
+        out_shp = exp_shp_spec_fields(patches_fc, PATCHES_SHP_FIELDS, out_folder)
 
         arcpy.AddMessage(f"Shapefile saved to: {out_shp}.")
 
         return no_export
+
+
+def add_messages(messages):
+    """
+    Displays a list of messages as geoprocessing messages, joining them into blocks of MESSAGE_BLOCK_SIZE lines with one
+    AddMessage call per block. Returns nothing.
+
+    :param messages: list, the messages to display.
+    """
+    for i in range(0, len(messages), MESSAGE_BLOCK_SIZE):
+        arcpy.AddMessage("\n".join(messages[i:i + MESSAGE_BLOCK_SIZE]))